@@ -70,15 +70,17 @@ async def risk_triage(intent_data: dict[str, Any]) -> dict[str, Any]:
         # Validate and parse intent
         intent = ActionIntent(**intent_data)
 
-        # Run policy evaluation
+        # Run policy evaluation on the validated fields; triage_payload returns the
+        # result dict directly, skipping RiskTriageResult construction and model_dump()
         policy = ManPolicy()
-        result = policy.triage(intent)
+        result = policy.triage_payload(intent.__dict__)
 
         activity.logger.info(
-            f"Risk triage for '{intent.tool_name}': {result.risk_lane.value} ({result.reasoning})"
+            f"Risk triage for '{intent.tool_name}': "
+            f"{result['risk_lane'].value} ({result['reasoning']})"
         )
 
-        return result.model_dump()
+        return result
 
     except Exception as e:
         activity.logger.error(f"Risk triage failed: {str(e)}")
@@ -4,6 +4,7 @@ MAN Mode notification activity with idempotency.
 Sends push notifications to operators when high-risk actions require approval.
 """
 
+import asyncio
 from datetime import UTC, datetime
 from typing import Any
 
@@ -49,31 +50,32 @@ async def notify_man_task(params: dict[str, Any]) -> dict[str, Any]:
 
         db = get_database_provider()
 
-        notification_ids = []
-
-        for channel in channels:
-            # Create idempotency key per channel
-            idempotency_key = f"man_notify:{task_id}:{channel}"
+        # Fields shared by every channel's row; only the channel-specific ones vary
+        base_record = {
+            "task_id": task_id,
+            "workflow_id": workflow_id,
+            "step_id": step_id,
+            "message": message,
+            "metadata": metadata,
+            "sent_at": datetime.now(UTC).isoformat(),
+            "status": "sent",
+        }
+        key_prefix = f"man_notify:{task_id}:"
 
-            # Upsert notification (idempotent)
+        async def notify_channel(channel: str) -> str:
+            # Upsert notification (idempotent via a per-channel idempotency key)
             notification = await db.upsert(
                 table="man_notifications",
-                record={
-                    "idempotency_key": idempotency_key,
-                    "task_id": task_id,
-                    "workflow_id": workflow_id,
-                    "step_id": step_id,
-                    "channel": channel,
-                    "message": message,
-                    "metadata": metadata,
-                    "sent_at": datetime.now(UTC).isoformat(),
-                    "status": "sent",
-                },
+                record={**base_record, "idempotency_key": key_prefix + channel, "channel": channel},
                 conflict_columns=["idempotency_key"],
             )
 
-            notification_ids.append(str(notification["id"]))
             activity.logger.info(f"✓ Notification sent via {channel} for MAN task {task_id}")
+            return str(notification["id"])
+
+        # Channel rows are independent, so write them concurrently (one round trip of
+        # latency instead of one per channel); gather keeps the channel order
+        notification_ids = list(await asyncio.gather(*map(notify_channel, channels)))
 
         # Notification is triggered via Postgres Changes on 'man_notifications' table.
         # The 'realtime' channel in params acts as a metadata tag for the UI.
@@ -37,7 +37,7 @@ from pydantic import BaseModel
 from temporalio import activity
 
 from models.audit import AuditAction, AuditResourceType, AuditStatus, log_audit_event
-from providers.database.factory import get_database_provider
+from providers.database.factory import get_database_provider, reset_database_provider
 from security.prompt_sanitizer import PromptInjectionError, create_safe_user_message
 
 # Canonical set of allowed tools (must match registered Temporal activities)
@@ -60,6 +60,7 @@ _TOOL_ALIASES: dict[str, str] = {
 # Global service instances (initialized in setup_activities())
 _semantic_cache = None  # SemanticCacheService instance
 _redis_client = None
+_webhook_client = None  # httpx.AsyncClient shared by call_webhook (see _get_webhook_client)
 
 
 # ============================================================================
@@ -87,6 +88,7 @@ async def setup_activities(
     # Set environment variables for database provider factory
     os.environ["SUPABASE_URL"] = supabase_url
     os.environ["SUPABASE_SERVICE_ROLE_KEY"] = supabase_key
+    reset_database_provider(reload_env=True)
 
     # Initialize semantic cache
     from infrastructure.cache import SemanticCacheService
@@ -517,6 +519,40 @@ async def send_email(params: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+def _get_webhook_client() -> Any:
+    """
+    Return the pooled HTTP client for webhooks, creating it on first use.
+
+    Reusing one client keeps connections alive across calls, so repeat calls to
+    the same host skip the TCP/TLS handshake.
+    """
+    global _webhook_client
+    import httpx
+
+    if _webhook_client is None or _webhook_client.is_closed:
+        _webhook_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _webhook_client
+
+
+async def aclose_webhook_client() -> None:
+    """
+    Close the pooled webhook client (call at worker shutdown).
+
+    The next call_webhook opens a fresh client.
+    """
+    global _webhook_client
+
+    client, _webhook_client = _webhook_client, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
 @activity.defn(name="call_webhook")
 async def call_webhook(params: dict[str, Any]) -> dict[str, Any]:
     """
@@ -532,8 +568,6 @@ async def call_webhook(params: dict[str, Any]) -> dict[str, Any]:
     Returns:
         Webhook response
     """
-    import httpx
-
     from security.ssrf import validate_url_async
 
     url = params.get("url")
@@ -552,19 +586,19 @@ async def call_webhook(params: dict[str, Any]) -> dict[str, Any]:
 
     activity.logger.info(f"Calling webhook: {method} {url}")
 
-    async with httpx.AsyncClient() as client:
-        response = await client.request(  # NOSONAR: SSRF risk mitigated by validate_url_async above
-            method=method,
-            url=url,
-            json=payload,
-            timeout=15.0,
-        )
+    client = _get_webhook_client()
+    response = await client.request(  # NOSONAR: SSRF risk mitigated by validate_url_async above
+        method=method,
+        url=url,
+        json=payload,
+        timeout=15.0,
+    )
 
-        return {
-            "success": response.status_code < 400,
-            "status_code": response.status_code,
-            "body": response.text,
-        }
+    return {
+        "success": response.status_code < 400,
+        "status_code": response.status_code,
+        "body": response.text,
+    }
 
 
 @activity.defn(name="search_youtube")
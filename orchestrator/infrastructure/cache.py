@@ -25,11 +25,15 @@ Architecture:
 - Entity extraction via regex patterns (extensible to NER models)
 """
 
+import asyncio
+import functools
 import hashlib
 import json
 import logging
 import re
-from typing import Any
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, ClassVar
 
 import numpy as np
 import redis.asyncio as aioredis
@@ -58,6 +62,17 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Template embeddings kept per service instance (templates repeat far more than goals)
+EMBEDDING_CACHE_MAX_ENTRIES = 1024
+
+# Cache misses arriving within this window are embedded in one model call
+EMBED_BATCH_MAX_SIZE = 8
+EMBED_BATCH_WINDOW_SECONDS = 0.002
+
+# Entity extraction results memoized per goal text; longer texts are not cached
+ENTITY_CACHE_MAX_ENTRIES = 1024
+ENTITY_CACHE_MAX_TEXT_LENGTH = 2048
+
 # ============================================================================
 # DATA MODELS
 # ============================================================================
@@ -111,6 +126,14 @@ class CachedPlan(BaseModel):
 # ============================================================================
 
 
+def _compile_patterns(patterns: dict[str, list[str]]) -> dict[str, tuple[re.Pattern[str], ...]]:
+    """Compile an entity-type -> regex list mapping (case-insensitive)."""
+    return {
+        entity_type: tuple(re.compile(pattern, re.IGNORECASE) for pattern in entity_patterns)
+        for entity_type, entity_patterns in patterns.items()
+    }
+
+
 class EntityExtractor:
     """
     Extract entities from natural language to create plan templates.
@@ -141,39 +164,81 @@ class EntityExtractor:
             r"\b\d+\s*(?:dollars?|euros?|pounds?)\b",
         ],
         "EMAIL": [
-            r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
+            # Bounded to RFC 5321 lengths so dotted runs like "a.a.a..." cannot
+            # backtrack quadratically (each "." is a new \b start position)
+            r"\b[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,255}\.[A-Z|a-z]{2,}\b",
         ],
     }
 
+    # Compiled once per class (extraction runs on every get_plan/store_plan);
+    # subclasses overriding PATTERNS are recompiled in __init_subclass__
+    _COMPILED_PATTERNS = _compile_patterns(PATTERNS)
+
+    # Per-class memo caches (see _reset_memos); stored on the class so they
+    # never outlive it or mix results between subclasses
+    _entities_memo: ClassVar[Callable[[str], tuple[tuple[str, tuple[str, ...]], ...]]]
+    _template_memo: ClassVar[Callable[[str], tuple[str, tuple[tuple[str, str], ...]]]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._COMPILED_PATTERNS = _compile_patterns(cls.PATTERNS)
+        cls._reset_memos()
+
+    @classmethod
+    def _reset_memos(cls) -> None:
+        """Give cls fresh bounded caches for extraction and template results."""
+        cls._entities_memo = staticmethod(
+            functools.lru_cache(maxsize=ENTITY_CACHE_MAX_ENTRIES)(cls._scan_entities)
+        )
+        cls._template_memo = staticmethod(
+            functools.lru_cache(maxsize=ENTITY_CACHE_MAX_ENTRIES)(cls._build_template)
+        )
+
     @classmethod
     def extract_entities(cls, text: str) -> dict[str, list[str]]:
         """
         Extract entities from text using regex patterns.
 
+        Memoized per text (extraction is deterministic); every call gets fresh lists.
+
         Returns:
             Dict mapping entity type to list of extracted values
             Example: {"DATE": ["tomorrow"], "LOCATION": ["Paris"]}
         """
-        entities: dict[str, list[str]] = {}
+        return {entity_type: list(values) for entity_type, values in cls._entities(text)}
+
+    @classmethod
+    def _entities(cls, text: str) -> tuple[tuple[str, tuple[str, ...]], ...]:
+        """Memoized extraction; oversized texts bypass the cache so it stays small."""
+        if len(text) > ENTITY_CACHE_MAX_TEXT_LENGTH:
+            return cls._scan_entities(text)
+        return cls._entities_memo(text)
+
+    @classmethod
+    def _scan_entities(cls, text: str) -> tuple[tuple[str, tuple[str, ...]], ...]:
+        """Run every pattern over text (uncached body of extract_entities)."""
+        entities: list[tuple[str, tuple[str, ...]]] = []
 
-        for entity_type, patterns in cls.PATTERNS.items():
+        for entity_type, patterns in cls._COMPILED_PATTERNS.items():
             matches = []
             for pattern in patterns:
-                found = re.findall(pattern, text, re.IGNORECASE)
+                found = pattern.findall(text)
                 if found:
                     # Handle both string matches and tuple matches from groups
                     matches.extend(found if isinstance(found[0], str) else [m for m in found if m])
 
             if matches:
-                entities[entity_type] = list(set(matches))  # Deduplicate
+                entities.append((entity_type, tuple(set(matches))))  # Deduplicate
 
-        return entities
+        return tuple(entities)
 
     @classmethod
     def create_template(cls, text: str) -> tuple[str, dict[str, str]]:
         """
         Convert natural language into parameterized template.
 
+        Memoized per text like extract_entities; the parameters dict is a fresh copy.
+
         Args:
             text: "Book flight to Paris tomorrow"
 
@@ -186,19 +251,31 @@ class EntityExtractor:
             >>> assert template == "Book flight to {LOCATION} {DATE}"
             >>> assert params == {"LOCATION": "Paris", "DATE": "tomorrow"}
         """
-        entities = cls.extract_entities(text)
+        if len(text) > ENTITY_CACHE_MAX_TEXT_LENGTH:
+            template, parameters = cls._build_template(text)
+        else:
+            template, parameters = cls._template_memo(text)
+        return template, dict(parameters)
+
+    @classmethod
+    def _build_template(cls, text: str) -> tuple[str, tuple[tuple[str, str], ...]]:
+        """Replace extracted entities with placeholders (uncached body of create_template)."""
         template = text
-        parameters = {}
+        parameters = []
 
         # Replace entities with placeholders (in order of appearance)
-        for entity_type, values in entities.items():
+        # Goes through extract_entities so subclasses overriding it are honoured
+        for entity_type, values in cls.extract_entities(text).items():
             for idx, value in enumerate(values):
                 # Use indexed placeholders if multiple of same type
                 placeholder = f"{{{entity_type}_{idx}}}" if idx > 0 else f"{{{entity_type}}}"
                 template = template.replace(value, placeholder, 1)
-                parameters[placeholder.strip("{}")] = value
+                parameters.append((placeholder.strip("{}"), value))
+
+        return template, tuple(parameters)
+
 
-        return template, parameters
+EntityExtractor._reset_memos()
 
 
 # ============================================================================
@@ -268,6 +345,13 @@ class SemanticCacheService:
         self.embedding_dim = self.embedding_model.get_sentence_embedding_dimension()
         logger.info(f"Model loaded ({self.embedding_dim} dimensions)")
 
+        # template_text -> read-only float32 embedding, least recently used first
+        self._embedding_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+
+        # Pending (template_text, future) pairs drained by _embed_worker
+        self._embed_queue: asyncio.Queue[tuple[str, asyncio.Future[np.ndarray]]] | None = None
+        self._embed_worker_task: asyncio.Task[None] | None = None
+
         # Redis index name
         self.index_name = "idx:plan_templates"
 
@@ -367,8 +451,8 @@ class SemanticCacheService:
         template_text, parameters = EntityExtractor.create_template(goal)
 
         # Step 2: Embed template
-        embedding = self.embedding_model.encode(template_text, convert_to_numpy=True)
-        embedding_bytes = embedding.astype(np.float32).tobytes()
+        embedding = await self._embed_template(template_text)
+        embedding_bytes = embedding.tobytes()
 
         # Step 3: Vector similarity search
         query = (
@@ -462,7 +546,7 @@ class SemanticCacheService:
             return template_id
 
         # Embed template
-        embedding = self.embedding_model.encode(template_text, convert_to_numpy=True)
+        embedding = await self._embed_template(template_text)
 
         # TiDB PERSISTENCE HOOK (Phase 4)
         # Idempotent upsert of embedding vector if persistence is enabled
@@ -504,7 +588,7 @@ class SemanticCacheService:
                 "template_id": plan_template.template_id,
                 "template_text": plan_template.template_text,
                 "plan_steps": json.dumps(plan_template.plan_steps),
-                "embedding": embedding.astype(np.float32).tobytes(),
+                "embedding": embedding.tobytes(),
                 "hit_count": 0,
                 "created_at": plan_template.created_at,
             },
@@ -516,6 +600,107 @@ class SemanticCacheService:
         logger.info(f"Cached new template: {template_id} (TTL={ttl_seconds or self.ttl_seconds}s)")
         return template_id
 
+    async def _embed_template(self, template_text: str) -> np.ndarray:
+        """
+        Embed a template, reusing the result for templates seen recently.
+
+        Goals that differ only in their entities share a template, so most lookups
+        skip model inference entirely. Misses are handed to _embed_worker, which
+        embeds concurrent requests together.
+        """
+        embedding = self._embedding_cache.get(template_text)
+        if embedding is not None:
+            self._embedding_cache.move_to_end(template_text)
+            return embedding
+
+        queue = self._embed_queue
+        if queue is None or self._embed_worker_task is None or self._embed_worker_task.done():
+            queue = self._embed_queue = asyncio.Queue()
+            self._embed_worker_task = asyncio.create_task(self._embed_worker(queue))
+
+        future: asyncio.Future[np.ndarray] = asyncio.get_running_loop().create_future()
+        await queue.put((template_text, future))
+        embedding = await future
+
+        self._embedding_cache[template_text] = embedding
+        self._embedding_cache.move_to_end(template_text)
+        if len(self._embedding_cache) > EMBEDDING_CACHE_MAX_ENTRIES:
+            self._embedding_cache.popitem(last=False)
+        return embedding
+
+    async def _embed_worker(
+        self, queue: asyncio.Queue[tuple[str, asyncio.Future[np.ndarray]]]
+    ) -> None:
+        """
+        Embed queued templates in micro-batches.
+
+        Waits up to EMBED_BATCH_WINDOW_SECONDS after the first request for up to
+        EMBED_BATCH_MAX_SIZE requests, then encodes them in one model call off the
+        event loop (one batched forward pass costs about the same as a single one).
+        """
+        loop = asyncio.get_running_loop()
+        batch: list[tuple[str, asyncio.Future[np.ndarray]]] = []
+
+        try:
+            while True:
+                batch = [await queue.get()]
+                await self._embed_batch(loop, queue, batch)
+        except asyncio.CancelledError:
+            # Callers await these futures with no timeout; fail them rather than
+            # leave them hanging once the worker is gone
+            stopped = RuntimeError("Embedding worker stopped")
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(stopped)
+            raise
+
+    async def _embed_batch(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        queue: asyncio.Queue[tuple[str, asyncio.Future[np.ndarray]]],
+        batch: list[tuple[str, asyncio.Future[np.ndarray]]],
+    ) -> None:
+        """Fill batch from the queue within the batch window, then resolve it."""
+        deadline = loop.time() + EMBED_BATCH_WINDOW_SECONDS
+        while len(batch) < EMBED_BATCH_MAX_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except TimeoutError:
+                break
+
+        # The same template may be queued by several callers; encode it once
+        texts = list(dict.fromkeys(text for text, _ in batch))
+        try:
+            embeddings = await loop.run_in_executor(
+                None,
+                functools.partial(
+                    self.embedding_model.encode,
+                    texts,
+                    batch_size=len(texts),
+                    convert_to_numpy=True,
+                ),
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        by_text = {}
+        for text, row in zip(texts, embeddings, strict=True):
+            row = np.asarray(row, dtype=np.float32)
+            # Shared between callers, so guard against in-place edits
+            row.setflags(write=False)
+            by_text[text] = row
+        for text, future in batch:
+            if not future.done():
+                future.set_result(by_text[text])
+
     def _inject_parameters(
         self, plan_steps: list[dict[str, Any]], parameters: dict[str, str]
     ) -> list[dict[str, Any]]:
@@ -577,7 +762,14 @@ class SemanticCacheService:
         return datetime.now(UTC).isoformat().replace("+00:00", "Z")
 
     async def close(self) -> None:
-        """Close Redis connection."""
+        """Stop the embedding worker and close Redis connection."""
+        worker, self._embed_worker_task = self._embed_worker_task, None
+        self._embed_queue = None
+        if worker is not None:
+            worker.cancel()
+            # Let the worker fail its pending callers before returning (wait() does
+            # not re-raise the worker's CancelledError, but still honours our own)
+            await asyncio.wait({worker})
         if self.redis:
             await self.redis.close()
             logger.info("Redis connection closed")
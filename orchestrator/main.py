@@ -18,8 +18,11 @@ Usage:
 """
 
 import asyncio
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 
 from fastapi import FastAPI, HTTPException
@@ -43,6 +46,7 @@ from activities.notify_man_task import notify_man_task
 from activities.omni_policy import evaluate_policy_activity
 from activities.omnitrace_activities import get_omnitrace_activities
 from activities.tools import (
+    aclose_webhook_client,
     call_webhook,
     check_semantic_cache,
     create_record,
@@ -137,11 +141,19 @@ async def health_check():
     return {"status": "ok"}
 
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, settings.log_level),
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+# Configure logging. Records are queued and written to stderr by a background
+# thread, so a slow console never blocks the event loop mid-activity.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_console_handler = logging.StreamHandler()
+_console_handler.setFormatter(
+    logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
 )
+_log_listener = logging.handlers.QueueListener(_log_queue, _console_handler)
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))  # Listener adds the prefix
+logging.basicConfig(level=getattr(logging, settings.log_level), handlers=[_queue_handler])
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Flush queued records on shutdown
 logger = logging.getLogger(__name__)
 
 
@@ -218,7 +230,10 @@ async def start_worker() -> None:
     logger.info("Press Ctrl+C to stop")
 
     # Run worker until interrupted
-    await worker.run()
+    try:
+        await worker.run()
+    finally:
+        await aclose_webhook_client()
 
 
 async def submit_workflow(goal: str, user_id: str = "test-user") -> None:
@@ -12,6 +12,7 @@ All audit events must be logged using this schema to maintain:
 - Standardized metadata for enterprise integration
 """
 
+import sys
 from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
@@ -282,26 +283,19 @@ class AuditLogger:
             )
 
         except Exception as e:
-            # CRITICAL: Never silently lose audit logs
-            import sys
-
-            # Log critical error to stderr
-            print(
-                f"CRITICAL: Audit persistence failed: {e}",
-                file=sys.stderr,
-            )
-
-            # Fallback: Log essential audit data to stderr
+            # CRITICAL: Never silently lose audit logs. Both lines go out in one
+            # synchronous write, so concurrent failures cannot interleave them and
+            # nothing sits in a buffer that a crash could drop.
             # DO NOT log sensitive data like secrets or PII
-            print(
+            sys.stderr.write(
+                f"CRITICAL: Audit persistence failed: {e}\n"
                 f"AUDIT_FALLBACK: id={event.id} "
                 f"action={event.action} "
                 f"resource_type={event.resource_type} "
                 f"resource_id={event.resource_id} "
                 f"actor_id={event.actor_id} "
                 f"status={event.status} "
-                f"timestamp={event.timestamp.isoformat()}",
-                file=sys.stderr,
+                f"timestamp={event.timestamp.isoformat()}\n"
             )
 
     async def _store_file(self, event: AuditLogEntry) -> None:
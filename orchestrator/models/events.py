@@ -11,6 +11,7 @@ Design Principles:
 4. Strict validation with no implicit coercion
 """
 
+import time
 from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
@@ -21,6 +22,26 @@ from pydantic import BaseModel, Field, field_validator
 # Constant for UTC offset string (used in ISO 8601 timestamp parsing)
 UTC_OFFSET_SUFFIX = "+00:00"
 
+# (epoch second, "YYYY-MM-DDTHH:MM:SS" for that second), reused by _utc_now_iso
+_iso_second_cache: tuple[int, str] = (-1, "")
+
+
+def _utc_now_iso() -> str:
+    """
+    Current UTC time as an ISO 8601 string with microseconds and a "Z" suffix.
+
+    Default factory for event timestamps: the date/time prefix is formatted once per
+    second and only the fractional part is rendered per call.
+    """
+    global _iso_second_cache
+    second, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _iso_second_cache
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second, UTC).strftime("%Y-%m-%dT%H:%M:%S")
+        _iso_second_cache = (second, prefix)
+    return f"{prefix}.{nanos // 1000:06d}Z"
+
+
 # ============================================================================
 # ENUMS (Matching TypeScript Union Types)
 # ============================================================================
@@ -155,7 +176,7 @@ class EventEnvelope(BaseModel):
     event_type: EventType = Field(..., description="Event type: {app}:{domain}.{action}")
     payload: dict[str, Any] = Field(..., description="Event payload (app-specific)")
     timestamp: str = Field(
-        default_factory=lambda: datetime.now(UTC).isoformat().replace(UTC_OFFSET_SUFFIX, "Z"),
+        default_factory=_utc_now_iso,
         description="ISO 8601 timestamp",
     )
     source: AppName = Field(..., description="Source app that emitted the event")
@@ -211,9 +232,7 @@ class AgentEvent(BaseModel):
     """
 
     event_id: str = Field(default_factory=lambda: str(uuid4()))
-    timestamp: str = Field(
-        default_factory=lambda: datetime.now(UTC).isoformat().replace(UTC_OFFSET_SUFFIX, "Z")
-    )
+    timestamp: str = Field(default_factory=_utc_now_iso)
     correlation_id: str = Field(..., description="Links all events in a workflow instance")
 
     model_config = {"frozen": True}
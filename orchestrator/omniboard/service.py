@@ -1,9 +1,12 @@
+import functools
 import logging
 import uuid
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+MATCH_CACHE_MAX_ENTRIES = 1024
+
 
 class OmniBoardService:
     """
@@ -28,6 +31,21 @@ class OmniBoardService:
         "GitHub",
     ]
 
+    # (providers snapshot, ((lowercased name, name), ...)), rebuilt by _provider_index
+    # whenever KNOWN_PROVIDERS changes
+    _lower_index: tuple[list[str], tuple[tuple[str, str], ...]] = ([], ())
+
+    @classmethod
+    def _provider_index(cls) -> tuple[tuple[str, str], ...]:
+        """Return (lowercased name, name) pairs for KNOWN_PROVIDERS, lowering each once."""
+        snapshot, index = cls._lower_index
+        if snapshot != cls.KNOWN_PROVIDERS:
+            snapshot = list(cls.KNOWN_PROVIDERS)
+            index = tuple((provider.lower(), provider) for provider in snapshot)
+            # Single assignment so concurrent readers never see a mismatched pair
+            cls._lower_index = (snapshot, index)
+        return index
+
     @classmethod
     def fuzzy_match_provider(cls, input_text: str) -> list[str]:
         """
@@ -52,35 +70,8 @@ class OmniBoardService:
         if not query_clean:
             return []
 
-        query_lower = query_clean.lower()
-        matches = []
-
-        for provider in cls.KNOWN_PROVIDERS:
-            provider_lower = provider.lower()
-            score = 0
-
-            # Exact match
-            if provider_lower == query_lower:
-                score = 1000
-            # Starts with query
-            elif provider_lower.startswith(query_lower):
-                score = 500
-            # Contains query
-            elif query_lower in provider_lower:
-                score = 250
-            # Reverse: query contains provider
-            elif provider_lower in query_lower:
-                score = 100
-
-            if score > 0:
-                # Penalize longer names (tie-breaker)
-                score -= len(provider) * 0.1
-                matches.append((score, provider))
-
-        # Sort by score (descending), then provider name (ascending)
-        matches.sort(key=lambda x: (-x[0], x[1]))
-
-        return [provider for _, provider in matches]
+        # Cached per (query, provider index); a copy keeps callers from mutating it
+        return list(_match_providers(query_clean.lower(), cls._provider_index()))
 
     @classmethod
     def generate_oauth_url(cls, provider: str, tenant_id: str) -> str:
@@ -173,3 +164,38 @@ class OmniBoardService:
         """MOCK: Rotates credentials. Returns new token ref."""
         logger.info("Rotating provider credentials")
         return f"vault://rotated/{connection_id}/token"
+
+
+@functools.lru_cache(maxsize=MATCH_CACHE_MAX_ENTRIES)
+def _match_providers(query_lower: str, index: tuple[tuple[str, str], ...]) -> tuple[str, ...]:
+    """
+    Rank providers in index against an already stripped, lowercased query.
+
+    Keyed on the index itself, so a changed KNOWN_PROVIDERS never hits stale entries.
+    """
+    # (rank, name length, name): plain tuples sort best-first without a key function
+    matches: list[tuple[int, int, str]] = []
+
+    for provider_lower, provider in index:
+        # Exact match
+        if provider_lower == query_lower:
+            rank = 0
+        # Starts with query
+        elif provider_lower.startswith(query_lower):
+            rank = 1
+        # Contains query
+        elif query_lower in provider_lower:
+            rank = 2
+        # Reverse: query contains provider
+        elif provider_lower in query_lower:
+            rank = 3
+        else:
+            continue
+
+        # Shorter names break ties within a rank
+        matches.append((rank, len(provider), provider))
+
+    # Sort by rank, then length, then provider name (ascending)
+    matches.sort()
+
+    return tuple(provider for _, _, provider in matches)
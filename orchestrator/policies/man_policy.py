@@ -11,7 +11,7 @@ Design Principles:
 4. Extensible (subclass for custom policies)
 """
 
-from typing import Any
+from typing import Any, ClassVar
 from uuid import uuid4
 
 from models.man_mode import ActionIntent, RiskLane, RiskTriageResult
@@ -86,6 +86,9 @@ HIGH_RISK_PARAMS: dict[str, list[str]] = {
     "admin": ["true", "True", "1"],  # Admin operations
 }
 
+# Read from the model so triage_payload() tracks triage().model_dump() if it changes
+_IS_DEMO_DEFAULT: bool = RiskTriageResult.model_fields["is_demo"].default
+
 
 # ============================================================================
 # POLICY ENGINE
@@ -109,6 +112,22 @@ class ManPolicy:
             pass
     """
 
+    __slots__ = (
+        "sensitive_tools",
+        "blocked_tools",
+        "safe_tools",
+        "_sensitive_lower",
+        "_blocked_lower",
+        "_safe_lower",
+    )
+
+    # Lowercase default sets, computed once and shared by default-configured policies
+    _DEFAULT_SENSITIVE_LOWER: ClassVar[frozenset[str]] = frozenset(
+        t.lower() for t in SENSITIVE_TOOLS
+    )
+    _DEFAULT_BLOCKED_LOWER: ClassVar[frozenset[str]] = frozenset(t.lower() for t in BLOCKED_TOOLS)
+    _DEFAULT_SAFE_LOWER: ClassVar[frozenset[str]] = frozenset(t.lower() for t in SAFE_TOOLS)
+
     def __init__(
         self,
         sensitive_tools: set[str] | None = None,
@@ -127,10 +146,21 @@ class ManPolicy:
         self.blocked_tools = blocked_tools or BLOCKED_TOOLS
         self.safe_tools = safe_tools or SAFE_TOOLS
 
-        # Pre-compute lowercase sets for O(1) lookups (performance optimization)
-        self._sensitive_lower: frozenset[str] = frozenset(t.lower() for t in self.sensitive_tools)
-        self._blocked_lower: frozenset[str] = frozenset(t.lower() for t in self.blocked_tools)
-        self._safe_lower: frozenset[str] = frozenset(t.lower() for t in self.safe_tools)
+        # Pre-compute lowercase sets for O(1) lookups (performance optimization).
+        # Default tool sets reuse the class-level frozensets instead of rebuilding them.
+        self._sensitive_lower: frozenset[str] = (
+            frozenset(t.lower() for t in sensitive_tools)
+            if sensitive_tools
+            else self._DEFAULT_SENSITIVE_LOWER
+        )
+        self._blocked_lower: frozenset[str] = (
+            frozenset(t.lower() for t in blocked_tools)
+            if blocked_tools
+            else self._DEFAULT_BLOCKED_LOWER
+        )
+        self._safe_lower: frozenset[str] = (
+            frozenset(t.lower() for t in safe_tools) if safe_tools else self._DEFAULT_SAFE_LOWER
+        )
 
     def triage(self, intent: ActionIntent) -> RiskTriageResult:
         """
@@ -150,75 +180,86 @@ class ManPolicy:
         Returns:
             RiskTriageResult with classification details
         """
-        tool_name = intent.tool_name.lower()
-        risk_factors: list[str] = []
+        lane, reasoning, requires_approval = self._classify(
+            intent.tool_name, intent.params, intent.irreversible
+        )
+        return RiskTriageResult(
+            task_id=uuid4().hex,
+            risk_lane=lane,
+            reasoning=reasoning,
+            requires_approval=requires_approval,
+        )
 
-        # 1. BLOCKED lane: prohibited tools
-        if tool_name in self._blocked_lower:
-            return RiskTriageResult(
-                task_id=uuid4().hex,
-                risk_lane=RiskLane.BLOCKED,
-                reasoning=f"Tool '{intent.tool_name}' is prohibited",
-                requires_approval=False,  # Never execute, no point in approval
-            )
+    def triage_payload(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """
+        Classify a trusted, already-validated intent dict without Pydantic.
+
+        Reads only ``tool_name``, ``params`` and ``irreversible`` from the payload
+        and returns the same shape as ``triage(intent).model_dump()``. Use
+        ``triage()`` when the payload still needs validation.
+
+        Args:
+            payload: ActionIntent fields as a plain dict
+
+        Returns:
+            RiskTriageResult fields as a dict
+        """
+        lane, reasoning, requires_approval = self._classify(
+            payload.get("tool_name") or "",
+            payload.get("params") or {},
+            bool(payload.get("irreversible", False)),
+        )
+        return {
+            "task_id": uuid4().hex,
+            "risk_lane": lane,
+            "reasoning": reasoning,
+            "is_demo": _IS_DEMO_DEFAULT,
+            "requires_approval": requires_approval,
+        }
+
+    def _classify(
+        self, tool_name: str, params: dict[str, Any], irreversible: bool
+    ) -> tuple[RiskLane, str, bool]:
+        """
+        Apply the triage rules (see triage()) to raw intent fields.
+
+        Returns:
+            Tuple of (risk lane, reasoning, requires_approval)
+        """
+        tool_key = tool_name.lower()
+
+        # 1. BLOCKED lane: prohibited tools (never execute, no point in approval)
+        if tool_key in self._blocked_lower:
+            return RiskLane.BLOCKED, f"Tool '{tool_name}' is prohibited", False
 
         # 2. RED lane: sensitive tools
-        if tool_name in self._sensitive_lower:
-            risk_factors.append("sensitive_tool")
-            return RiskTriageResult(
-                task_id=uuid4().hex,
-                risk_lane=RiskLane.RED,
-                reasoning=f"Tool '{intent.tool_name}' requires human approval",
-                requires_approval=True,
-            )
+        if tool_key in self._sensitive_lower:
+            return RiskLane.RED, f"Tool '{tool_name}' requires human approval", True
 
         # 3. RED lane: explicitly marked irreversible
-        if intent.irreversible:
-            risk_factors.append("marked_irreversible")
-            return RiskTriageResult(
-                task_id=uuid4().hex,
-                risk_lane=RiskLane.RED,
-                reasoning="Action is marked as irreversible",
-                requires_approval=True,
-            )
+        if irreversible:
+            return RiskLane.RED, "Action is marked as irreversible", True
 
         # 4. Check for high-risk parameters
-        param_risk = self._evaluate_params(intent.params)
-        risk_factors.extend(param_risk)
+        param_risk = self._evaluate_params(params)
 
         if len(param_risk) >= 2:
             # Multiple high-risk params → RED
-            return RiskTriageResult(
-                task_id=uuid4().hex,
-                risk_lane=RiskLane.RED,
-                reasoning=f"Multiple high-risk parameters detected: {', '.join(risk_factors)}",
-                requires_approval=True,
+            return (
+                RiskLane.RED,
+                f"Multiple high-risk parameters detected: {', '.join(param_risk)}",
+                True,
             )
         if len(param_risk) == 1:
             # Single high-risk param → YELLOW (logged but auto-execute)
-            return RiskTriageResult(
-                task_id=uuid4().hex,
-                risk_lane=RiskLane.YELLOW,
-                reasoning=f"High-risk parameter detected: {param_risk[0]}",
-                requires_approval=False,
-            )
+            return RiskLane.YELLOW, f"High-risk parameter detected: {param_risk[0]}", False
 
         # 5. GREEN lane: explicitly safe tools
-        if tool_name in self._safe_lower:
-            return RiskTriageResult(
-                task_id=uuid4().hex,
-                risk_lane=RiskLane.GREEN,
-                reasoning="Tool is classified as safe",
-                requires_approval=False,
-            )
+        if tool_key in self._safe_lower:
+            return RiskLane.GREEN, "Tool is classified as safe", False
 
         # 6. Default: YELLOW (unknown tools - log but execute)
-        return RiskTriageResult(
-            task_id=uuid4().hex,
-            risk_lane=RiskLane.YELLOW,
-            reasoning="Unknown tool - executing with audit logging",
-            requires_approval=False,
-        )
+        return RiskLane.YELLOW, "Unknown tool - executing with audit logging", False
 
     def _evaluate_params(self, params: dict[str, Any]) -> list[str]:
         """
@@ -10,15 +10,53 @@ from typing import Any, Protocol
 
 
 class DatabaseError(Exception):
-    """Base exception for database operations."""
+    """
+    Base exception for database operations.
+
+    Raised either with a complete message, or with the failed operation and the
+    underlying exception as ``cause``. In the latter case the
+    "<operation> failed: <cause>" message is only built when the error is rendered.
+    """
+
+    def __init__(self, message: str, cause: BaseException | None = None) -> None:
+        super().__init__(message)
+        self.message = message
+        self.cause = cause
 
-    pass
+    def __str__(self) -> str:
+        if self.cause is None:
+            return self.message
+        return f"{self.message} failed: {self.cause}"
 
 
 class NotFoundError(DatabaseError):
-    """Raised when a requested record is not found."""
+    """
+    Raised when a requested record is not found.
+
+    The message is formatted lazily from ``table``, ``filters`` and ``operation``
+    ("select" or "update"), so callers that only catch the error (e.g. existence
+    probes) never pay for building it.
+    """
 
-    pass
+    def __init__(
+        self, table: str, filters: dict[str, Any] | None = None, operation: str = "select"
+    ) -> None:
+        # Skip DatabaseError.__init__ so args keeps both lookup details (repr, pickling)
+        super(DatabaseError, self).__init__(table, filters)
+        self.table = table
+        self.filters = filters or {}
+        self.operation = operation
+        self.cause = None
+
+    @property
+    def message(self) -> str:
+        return str(self)
+
+    def __str__(self) -> str:
+        if self.operation == "update":
+            return f"No records to update in {self.table} with {self.filters}"
+        params_str = ", ".join(f"{k}={v}" for k, v in self.filters.items())
+        return f"Record not found in {self.table} matching: {params_str}"
 
 
 class DatabaseProvider(Protocol):
@@ -6,6 +6,7 @@ This enables runtime switching between different database backends.
 """
 
 import os
+from dataclasses import dataclass
 
 from infrastructure.tidb_persistence import TiDBVectorPersistence
 
@@ -13,22 +14,45 @@ from .base import DatabaseProvider
 from .supabase_provider import SupabaseDatabaseProvider
 
 
+@dataclass(frozen=True, slots=True)
+class _DBEnv:
+    """Snapshot of the environment variables that select and configure the provider."""
+
+    provider: str
+    supabase_url: str | None
+    supabase_key: str | None
+
+
+# Read lazily on first use (setup_activities() exports the Supabase settings after import)
+_db_env: _DBEnv | None = None
+
+
+def _get_db_env() -> _DBEnv:
+    """Return the cached provider environment, reading it on first call."""
+    global _db_env
+
+    if _db_env is None:
+        _db_env = _DBEnv(
+            provider=os.getenv("DATABASE_PROVIDER", "supabase").lower(),
+            supabase_url=os.getenv("SUPABASE_URL"),
+            supabase_key=os.getenv("SUPABASE_SERVICE_ROLE_KEY"),
+        )
+    return _db_env
+
+
 class DatabaseFactory:
     @staticmethod
     def get_provider() -> DatabaseProvider:
-        provider_type = os.getenv("DATABASE_PROVIDER", "supabase").lower()
+        env = _get_db_env()
+        provider_type = env.provider
 
         if provider_type == "supabase":
-            # Get Supabase configuration
-            supabase_url = os.getenv("SUPABASE_URL")
-            supabase_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-
-            if not supabase_url or not supabase_key:
+            if not env.supabase_url or not env.supabase_key:
                 raise ValueError(
                     "Supabase database provider requires SUPABASE_URL and "
                     "SUPABASE_SERVICE_ROLE_KEY environment variables"
                 )
-            return SupabaseDatabaseProvider(url=supabase_url, key=supabase_key)
+            return SupabaseDatabaseProvider(url=env.supabase_url, key=env.supabase_key)
 
         if provider_type == "tidb":
             return TiDBVectorPersistence()  # type: ignore # APEX-DEV G2: Portability
@@ -64,11 +88,17 @@ def get_database_provider() -> DatabaseProvider:
     return _db_provider
 
 
-def reset_database_provider() -> None:
+def reset_database_provider(reload_env: bool = False) -> None:
     """
     Reset the database provider singleton.
 
     Useful for testing or when configuration changes.
+
+    Args:
+        reload_env: Also drop the cached environment snapshot so the next
+            provider is built from the current environment variables
     """
-    global _db_provider
+    global _db_provider, _db_env
     _db_provider = None
+    if reload_env:
+        _db_env = None
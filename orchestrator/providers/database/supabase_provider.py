@@ -1,5 +1,10 @@
+import asyncio
+import os
 import re
-from typing import Any
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, ClassVar
 
 from supabase import Client, create_client
 
@@ -38,6 +43,12 @@ ALLOWED_TABLES = frozenset(
     ]
 )
 
+# Max concurrent PostgREST requests per process (the SDK client is synchronous)
+SUPABASE_MAX_WORKERS = 16
+
+# Max cached select_one rows across all tables (read-through cache, see select_one)
+SELECT_CACHE_MAX_ENTRIES = 10_000
+
 # Valid column name pattern (alphanumeric and underscore only)
 VALID_COLUMN_PATTERN = re.compile(r"^[a-zA-Z_]\w*$")
 
@@ -78,10 +89,64 @@ class SupabaseDatabaseProvider(DatabaseProvider):
     - Table name validation against allowlist
     - Column name format validation
     - Parameterized queries via Supabase SDK
+
+    The Supabase SDK client is synchronous, so every request is executed on a
+    bounded thread pool, shared by all providers in the process, to keep the
+    event loop free during the HTTP round-trip. Clients are cached per
+    (url, key), so re-created providers (tests, factory resets) share one
+    underlying HTTP connection pool and never leak worker threads.
+
+    select_one() can serve repeated lookups from an in-memory read-through
+    cache (opt-in via select_cache_ttl_seconds / SUPABASE_SELECT_CACHE_TTL_SECONDS).
+    Writes through this provider drop the cached rows of the table they touch
+    (including rows from reads still in flight); writes made elsewhere become
+    visible once the TTL expires.
     """
 
-    def __init__(self, url: str, key: str):
-        self.client: Client = create_client(url, key)
+    _client_cache: ClassVar[dict[tuple[str, str], Client]] = {}
+    # Threads start lazily on first request
+    _executor: ClassVar[ThreadPoolExecutor] = ThreadPoolExecutor(
+        max_workers=SUPABASE_MAX_WORKERS, thread_name_prefix="supabase"
+    )
+
+    def __init__(self, url: str, key: str, select_cache_ttl_seconds: float | None = None):
+        self.client: Client = self._get_client(url, key)
+        # 0 disables the select_one cache
+        self.select_cache_ttl_seconds = (
+            select_cache_ttl_seconds
+            if select_cache_ttl_seconds is not None
+            else float(os.getenv("SUPABASE_SELECT_CACHE_TTL_SECONDS", "0"))
+        )
+        # (table, sorted filter items) -> (table generation, expires_at, row), oldest first
+        self._select_cache: dict[
+            tuple[str, tuple[Any, ...]], tuple[int, float, dict[str, Any]]
+        ] = {}
+        # table -> generation, bumped by invalidate(); rows cached under an older
+        # generation are stale
+        self._select_generation: dict[str, int] = {}
+
+    @classmethod
+    def _get_client(cls, url: str, key: str) -> Client:
+        """Return the shared client for these credentials, creating it on first use."""
+        client = cls._client_cache.get((url, key))
+        if client is None:
+            client = cls._client_cache[(url, key)] = create_client(url, key)
+        return client
+
+    @classmethod
+    def clear_client_cache(cls) -> None:
+        """Drop all cached clients (e.g. after rotating credentials)."""
+        cls._client_cache.clear()
+
+    def invalidate(self, table: str) -> None:
+        """Drop all cached select_one rows for a table, including reads still in flight."""
+        table = table.strip().lower()
+        self._select_generation[table] = self._select_generation.get(table, 0) + 1
+
+    async def _execute(self, query: Any) -> Any:
+        """Run a blocking query builder's execute() on the shared thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, query.execute)
 
     async def connect(self) -> None:
         """
@@ -102,14 +167,16 @@ class SupabaseDatabaseProvider(DatabaseProvider):
             # SECURITY: Validate table name against allowlist
             validated_table = validate_table_name(table)
 
-            response = self.client.table(validated_table).insert(record).execute()
+            query = self.client.table(validated_table).insert(record)
+            response = await self._execute(query)
+            self.invalidate(validated_table)
             if not response.data:
                 raise DatabaseError(f"Insert failed: No data from {validated_table}")
             return response.data[0]
         except DatabaseError:
             raise
         except Exception as e:
-            raise DatabaseError(f"Database insert failed: {str(e)}") from e
+            raise DatabaseError("Database insert", e) from e
 
     async def upsert(
         self,
@@ -125,7 +192,8 @@ class SupabaseDatabaseProvider(DatabaseProvider):
             validated_table = validate_table_name(table)
 
             query = self.client.table(validated_table).upsert(record)
-            response = query.execute()
+            response = await self._execute(query)
+            self.invalidate(validated_table)
 
             if not response.data:
                 raise DatabaseError(f"Upsert failed: No data from {validated_table}")
@@ -133,7 +201,7 @@ class SupabaseDatabaseProvider(DatabaseProvider):
         except DatabaseError:
             raise
         except Exception as e:
-            raise DatabaseError(f"Database upsert failed: {str(e)}") from e
+            raise DatabaseError("Database upsert", e) from e
 
     async def get(self, table: str, query_params: dict[str, Any]) -> list[dict[str, Any]]:
         try:
@@ -147,12 +215,36 @@ class SupabaseDatabaseProvider(DatabaseProvider):
                 validated_key = validate_column_name(key)
                 query = query.eq(validated_key, value)
 
-            response = query.execute()
+            response = await self._execute(query)
             return response.data
         except DatabaseError:
             raise
         except Exception as e:
-            raise DatabaseError(f"Database get failed: {str(e)}") from e
+            raise DatabaseError("Database get", e) from e
+
+    async def _select_limited(
+        self, table: str, query_params: dict[str, Any], limit: int
+    ) -> list[dict[str, Any]]:
+        """
+        Same as get(), but caps the number of rows PostgREST returns.
+        """
+        try:
+            # SECURITY: Validate table name against allowlist
+            validated_table = validate_table_name(table)
+
+            query = self.client.table(validated_table).select("*")
+
+            # SECURITY: Validate column names in query params
+            for key, value in query_params.items():
+                validated_key = validate_column_name(key)
+                query = query.eq(validated_key, value)
+
+            response = await self._execute(query.limit(limit))
+            return response.data
+        except DatabaseError:
+            raise
+        except Exception as e:
+            raise DatabaseError("Database get", e) from e
 
     async def select(
         self,
@@ -184,21 +276,92 @@ class SupabaseDatabaseProvider(DatabaseProvider):
                     validated_key = validate_column_name(key)
                     query = query.eq(validated_key, value)
 
-            response = query.execute()
+            response = await self._execute(query)
             return response.data or []
         except DatabaseError:
             raise
         except Exception as e:
-            raise DatabaseError(f"Database select failed: {str(e)}") from e
+            raise DatabaseError("Database select", e) from e
+
+    def prepare(
+        self,
+        table: str,
+        filter_cols: tuple[str, ...],
+        limit: int | None = None,
+    ) -> Callable[..., Awaitable[list[dict[str, Any]]]]:
+        """
+        Prepare a hot lookup with its table and filter columns pre-validated.
+
+        Validation runs once here; the returned coroutine function only binds
+        filter values positionally and executes the query.
+
+        Usage:
+            get_task = provider.prepare("man_tasks", ("id",), limit=1)
+            rows = await get_task(task_id)
+
+        Raises:
+            DatabaseError: If the table or a column name is not allowed
+        """
+        # SECURITY: Validate table and column names once, up front
+        validated_table = validate_table_name(table)
+        validated_cols = tuple(validate_column_name(col) for col in filter_cols)
+
+        async def _query(*values: Any) -> list[dict[str, Any]]:
+            if len(values) != len(validated_cols):
+                raise DatabaseError(
+                    f"Prepared query on {validated_table} expects "
+                    f"{len(validated_cols)} values, got {len(values)}"
+                )
+            try:
+                query = self.client.table(validated_table).select("*")
+                for col, value in zip(validated_cols, values, strict=True):
+                    query = query.eq(col, value)
+                if limit is not None:
+                    query = query.limit(limit)
+
+                response = await self._execute(query)
+                return response.data
+            except Exception as e:
+                raise DatabaseError("Database get", e) from e
+
+        return _query
 
     async def select_one(self, table: str, query_params: dict[str, Any]) -> dict[str, Any]:
         """
         Retrieve a single record. Raises NotFoundError if not found.
+
+        Served from the read-through cache when enabled; misses are never cached.
         """
-        results = await self.get(table, query_params)
+        cache_key: tuple[str, tuple[Any, ...]] | None = None
+        generation = 0
+        if self.select_cache_ttl_seconds > 0:
+            validated_table = validate_table_name(table)
+            try:
+                cache_key = (validated_table, tuple(sorted(query_params.items())))
+                hash(cache_key)
+            except TypeError:
+                cache_key = None  # Unhashable/unorderable filter values: bypass cache
+            else:
+                generation = self._select_generation.get(validated_table, 0)
+                cached = self._select_cache.get(cache_key)
+                if cached is not None:
+                    if cached[0] == generation and time.monotonic() < cached[1]:
+                        return dict(cached[2])
+                    del self._select_cache[cache_key]  # Written since, or expired
+
+        # Only one row is needed, so don't let PostgREST ship every match
+        results = await self._select_limited(table, query_params, 1)
         if not results:
-            params_str = ", ".join(f"{k}={v}" for k, v in query_params.items())
-            raise NotFoundError(f"Record not found in {table} matching: {params_str}")
+            raise NotFoundError(table, query_params)
+
+        # A write during the read may have made this row stale; cache it only if none did
+        if cache_key is not None and self._select_generation.get(validated_table, 0) == generation:
+            cache = self._select_cache
+            if cache_key not in cache and len(cache) >= SELECT_CACHE_MAX_ENTRIES:
+                # Evict the oldest entry (dicts preserve insertion order)
+                del cache[next(iter(cache))]
+            expires_at = time.monotonic() + self.select_cache_ttl_seconds
+            cache[cache_key] = (generation, expires_at, dict(results[0]))
         return results[0]
 
     async def update(
@@ -221,16 +384,17 @@ class SupabaseDatabaseProvider(DatabaseProvider):
                 validated_key = validate_column_name(key)
                 query = query.eq(validated_key, value)
 
-            response = query.execute()
+            response = await self._execute(query)
+            self.invalidate(validated_table)
 
             if not response.data:
-                raise NotFoundError(f"No records to update in {validated_table} with {filters}")
+                raise NotFoundError(validated_table, filters, operation="update")
 
             return response.data[0]
         except Exception as e:
             if isinstance(e, (DatabaseError, NotFoundError)):
                 raise
-            raise DatabaseError(f"Database update failed: {str(e)}") from e
+            raise DatabaseError("Database update", e) from e
 
     async def delete(self, table: str, filters: dict[str, Any]) -> int:
         """
@@ -253,12 +417,14 @@ class SupabaseDatabaseProvider(DatabaseProvider):
                 validated_key = validate_column_name(key)
                 query = query.eq(validated_key, value)
 
-            response = query.execute()
+            response = await self._execute(query)
+            self.invalidate(validated_table)
 
             return len(response.data) if response.data else 0
+        except DatabaseError:
+            raise
         except Exception as e:
-            # Catch-all for database errors, including DatabaseError
-            raise DatabaseError(f"Database delete failed: {str(e)}") from e
+            raise DatabaseError("Database delete", e) from e
 
     async def rpc(self, function_name: str, params: dict[str, Any]) -> Any:
         """
@@ -275,10 +441,10 @@ class SupabaseDatabaseProvider(DatabaseProvider):
             DatabaseError: For RPC call failures
         """
         try:
-            response = self.client.rpc(function_name, params).execute()
+            response = await self._execute(self.client.rpc(function_name, params))
             return response.data
         except Exception as e:
-            raise DatabaseError(f"RPC call to {function_name} failed: {str(e)}") from e
+            raise DatabaseError(f"RPC call to {function_name}", e) from e
 
 
 # Backwards compatibility alias
@@ -1,7 +1,7 @@
 import asyncio
+import importlib.abc
 import importlib.util
 import sys
-import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -49,6 +49,20 @@ CACHE_IMPORT = "from infrastructure.cache import SemanticCacheService"
 CACHE_MOCK = "SemanticCacheService = MagicMock"
 
 
+class _InMemorySourceLoader(importlib.abc.SourceLoader):
+    """Loads a module from a source string, without touching the filesystem."""
+
+    def __init__(self, source: str, origin: str) -> None:
+        self._source = source
+        self._origin = origin
+
+    def get_filename(self, _fullname: str) -> str:
+        return self._origin
+
+    def get_data(self, _path: str) -> bytes:
+        return self._source.encode("utf-8")
+
+
 def load_tools_module():
     """Load tools.py with mocked dependencies."""
     print("Reading activities/tools.py...")
@@ -61,25 +75,16 @@ def load_tools_module():
     code = code.replace(CACHE_IMPORT, CACHE_MOCK)
 
     print("Executing module with safe loader...")
-    # Use NamedTemporaryFile to avoid path injection vulnerability (S2083)
-    with tempfile.NamedTemporaryFile(
-        mode="w", suffix=".py", prefix="tools_sandbox_", encoding="utf-8", delete=False
-    ) as tmp_file:
-        tmp_file.write(code)
-        tmp_path = tmp_file.name
-
-    try:
-        spec = importlib.util.spec_from_file_location("tools_sandbox", tmp_path)
-        if spec is None or spec.loader is None:
-            raise RuntimeError("Failed to create module spec for tools_sandbox")
-
-        tools_mod = importlib.util.module_from_spec(spec)
-        sys.modules["tools_sandbox"] = tools_mod
-        spec.loader.exec_module(tools_mod)
-        return tools_mod
-    finally:
-        # Clean up temporary file
-        Path(tmp_path).unlink(missing_ok=True)
+    # Load from memory: no temp file to write, clean up, or inject a path into (S2083)
+    loader = _InMemorySourceLoader(code, origin="<tools_sandbox>")
+    spec = importlib.util.spec_from_loader("tools_sandbox", loader, origin="<tools_sandbox>")
+    if spec is None:
+        raise RuntimeError("Failed to create module spec for tools_sandbox")
+
+    tools_mod = importlib.util.module_from_spec(spec)
+    sys.modules["tools_sandbox"] = tools_mod
+    loader.exec_module(tools_mod)
+    return tools_mod
 
 
 # Load the module
@@ -17,8 +17,9 @@ import json
 import logging
 import os
 import time
-from collections.abc import Awaitable, Callable, Iterable
-from dataclasses import dataclass
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Any
 
 from models.audit import AuditAction, AuditResourceType, AuditStatus, log_audit_event
@@ -29,6 +30,12 @@ logger = logging.getLogger(__name__)
 
 PolicyLoader = Callable[[], Awaitable[list[dict[str, Any]]]]
 
+# Context fields a policy can constrain via "<field>_in" lists
+MATCH_FIELDS = ("tool", "action", "resource", "data_class")
+
+# Max memoized decisions per evaluator (oldest evicted first)
+DECISION_MEMO_MAX_ENTRIES = 1024
+
 
 @dataclass(frozen=True)
 class PolicyRecord:
@@ -41,6 +48,20 @@ class PolicyRecord:
     decision: str
     lane: str
     reason: str
+    # Lowercased "<field>_in" values, precomputed once per load; unconstrained fields omitted
+    match_sets: dict[str, frozenset[str]] = field(init=False, repr=False, compare=False)
+    # Deterministic ordering key: priority ASC, name ASC, version DESC
+    sort_key: tuple[int, str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        match = self.match or {}
+        match_sets = {}
+        for name in MATCH_FIELDS:
+            values = match.get(f"{name}_in")
+            if values:
+                match_sets[name] = frozenset(str(v).lower() for v in values)
+        object.__setattr__(self, "match_sets", match_sets)
+        object.__setattr__(self, "sort_key", (self.priority, self.name, -self.version))
 
 
 class OmniPolicyEvaluator:
@@ -50,6 +71,7 @@ class OmniPolicyEvaluator:
     - O(P) bounded matching (small P)
     - In-memory cache with TTL (no per-call DB hits)
     - Deterministic ordering: priority ASC, name ASC, version DESC
+    - Decisions memoized per normalized MATCH_FIELDS tuple until the next reload
     """
 
     def __init__(
@@ -64,6 +86,8 @@ class OmniPolicyEvaluator:
         self._cache: list[PolicyRecord] = []
         self._cache_expires_at: float = 0.0
         self._lock = asyncio.Lock()
+        # Normalized match-field values -> decision for the current policy set
+        self._decision_memo: dict[tuple[str, ...], dict[str, Any]] = {}
 
     async def _load_from_db(self) -> list[dict[str, Any]]:
         """Load enabled policies from DB."""
@@ -77,7 +101,13 @@ class OmniPolicyEvaluator:
 
     async def _get_policies(self) -> list[PolicyRecord]:
         """Return cached policies, refreshing on TTL expiry."""
+        # Fast path: a fresh cache needs no lock (refreshes swap the list, never mutate it)
+        cache = self._cache
+        if cache and time.monotonic() < self._cache_expires_at:
+            return cache
+
         async with self._lock:
+            # Re-check: another coroutine may have refreshed while we waited
             now = time.monotonic()
             if self._cache and now < self._cache_expires_at:
                 return self._cache
@@ -97,25 +127,19 @@ class OmniPolicyEvaluator:
             ]
 
             # Deterministic ordering
-            self._cache = sorted(
-                records,
-                key=lambda r: (r.priority, r.name, -r.version),
-            )
+            records.sort(key=attrgetter("sort_key"))
+            self._cache = records
             self._cache_expires_at = now + self.cache_ttl_seconds
+            self._decision_memo.clear()
             return self._cache
 
     @staticmethod
     def _matches(policy: PolicyRecord, ctx: dict[str, Any]) -> bool:
         """Bounded matcher: only *_in exact arrays, no regex."""
-        match = policy.match or {}
-
-        def field_matches(field: str) -> bool:
-            values: Iterable[str] | None = match.get(f"{field}_in")
-            if not values:
-                return True
-            return str(ctx.get(field, "")).lower() in {str(v).lower() for v in values}
-
-        return all(field_matches(field) for field in ("tool", "action", "resource", "data_class"))
+        for name, allowed in policy.match_sets.items():
+            if str(ctx.get(name, "")).lower() not in allowed:
+                return False
+        return True
 
     async def evaluate(self, ctx: dict[str, Any]) -> dict[str, Any]:
         """
@@ -132,6 +156,19 @@ class OmniPolicyEvaluator:
         """
         policies = await self._get_policies()
 
+        # Matching only looks at these normalized values, so they fully determine
+        # the decision for the current policy set
+        memo_key = tuple(str(ctx.get(name, "")).lower() for name in MATCH_FIELDS)
+        decision = self._decision_memo.get(memo_key)
+        if decision is None:
+            decision = self._decide(policies, ctx)
+            if len(self._decision_memo) >= DECISION_MEMO_MAX_ENTRIES:
+                del self._decision_memo[next(iter(self._decision_memo))]
+            self._decision_memo[memo_key] = decision
+        return dict(decision)
+
+    def _decide(self, policies: list[PolicyRecord], ctx: dict[str, Any]) -> dict[str, Any]:
+        """Return the decision of the first matching policy (or default allow)."""
         for policy in policies:
             if self._matches(policy, ctx):
                 return {
@@ -8,7 +8,10 @@ CVE Remediation: User-supplied goals and context were previously
 interpolated directly into LLM prompts, allowing manipulation.
 """
 
+import copy
 import re
+import threading
+from collections import OrderedDict
 from typing import Any
 
 # Patterns that indicate potential prompt injection attempts
@@ -53,6 +56,21 @@ INJECTION_PATTERNS = [
 # Compiled patterns for performance
 _COMPILED_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in INJECTION_PATTERNS]
 
+# Identifier-like context keys need no whitespace normalization, escaping or truncation,
+# and only the purely literal patterns (e.g. "jailbreak") can match inside them; every
+# other pattern requires whitespace or punctuation.
+_SAFE_KEY = re.compile(r"[A-Za-z0-9_]{1,64}\Z")
+_WORD_ONLY_PATTERNS = tuple(p for p in INJECTION_PATTERNS if re.fullmatch(r"\w+", p))
+
+_DEFAULT_CONTEXT_DEPTH = 3
+_MAX_CONTEXT_LIST_ITEMS = 100
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# sanitize_context results keyed by _context_cache_key, least recently used first
+CONTEXT_CACHE_MAX_ENTRIES = 256
+_context_cache: OrderedDict[tuple, dict[str, Any]] = OrderedDict()
+_context_cache_lock = threading.Lock()
+
 
 class PromptInjectionError(Exception):
     """Raised when prompt injection is detected in user input."""
@@ -79,6 +97,27 @@ def detect_injection(text: str) -> tuple[bool, str | None]:
     return False, None
 
 
+def _normalize_whitespace(text: str, max_length: int) -> str:
+    """
+    Collapse whitespace runs, skipping input that truncation would discard anyway.
+
+    Only the first ``max_length`` characters survive truncation, so oversized input
+    is normalized from a bounded prefix whenever that prefix (minus a word possibly
+    cut at the boundary) still exceeds ``max_length``. Otherwise, e.g. for input that
+    is mostly whitespace, the full text is normalized.
+    """
+    scan_limit = max_length * 4
+    if len(text) > scan_limit:
+        head = text[:scan_limit]
+        words = head.split()
+        if words and not text[scan_limit].isspace():
+            words.pop()  # May be a partial word
+        normalized = " ".join(words)
+        if len(normalized) > max_length:
+            return normalized
+    return " ".join(text.split())
+
+
 def sanitize_for_prompt(text: str, field_name: str = "input") -> str:
     """
     Sanitize user input for safe inclusion in LLM prompts.
@@ -109,8 +148,10 @@ def sanitize_for_prompt(text: str, field_name: str = "input") -> str:
             f"Potential prompt injection detected in {field_name}", pattern=pattern, input_text=text
         )
 
+    max_length = 2000
+
     # Normalize whitespace
-    sanitized = " ".join(text.split())
+    sanitized = _normalize_whitespace(text, max_length)
 
     # Escape characters that could be used for injection
     sanitized = sanitized.replace("\\", "\\\\")  # Escape backslashes first
@@ -121,38 +162,32 @@ def sanitize_for_prompt(text: str, field_name: str = "input") -> str:
     sanitized = sanitized.replace("]]", "] ]")
 
     # Truncate to prevent context overflow attacks
-    max_length = 2000
     if len(sanitized) > max_length:
         sanitized = sanitized[:max_length] + "... [truncated]"
 
     return sanitized
 
 
-def sanitize_context(context: dict[str, Any], max_depth: int = 3) -> dict[str, Any]:
-    """
-    Recursively sanitize a context dictionary.
-
-    Args:
-        context: Dictionary of context values
-        max_depth: Maximum nesting depth (prevents deep injection)
-
-    Returns:
-        Sanitized context dictionary
-    """
+def _sanitize_context(context: dict[str, Any], max_depth: int) -> dict[str, Any]:
+    """Uncached body of sanitize_context."""
     if max_depth <= 0:
         return {"_truncated": "max depth exceeded"}
 
     sanitized = {}
 
     for key, value in context.items():
-        # Sanitize key
-        safe_key = sanitize_for_prompt(str(key), f"context_key:{key}")
+        # Sanitize key (identifier-like keys skip the full scan)
+        key_str = str(key)
+        if _SAFE_KEY.match(key_str) and not any(p in key_str.lower() for p in _WORD_ONLY_PATTERNS):
+            safe_key = key_str
+        else:
+            safe_key = sanitize_for_prompt(key_str, f"context_key:{key}")
 
         # Sanitize value based on type
         if isinstance(value, str):
             safe_value = sanitize_for_prompt(value, f"context:{key}")
         elif isinstance(value, dict):
-            safe_value = sanitize_context(value, max_depth - 1)
+            safe_value = _sanitize_context(value, max_depth - 1)
         elif isinstance(value, list):
             safe_value = [
                 (
@@ -160,7 +195,7 @@ def sanitize_context(context: dict[str, Any], max_depth: int = 3) -> dict[str, A
                     if isinstance(item, str)
                     else item
                 )
-                for i, item in enumerate(value[:100])  # Limit list size
+                for i, item in enumerate(value[:_MAX_CONTEXT_LIST_ITEMS])  # Limit list size
             ]
         else:
             # Numbers, booleans, None - safe as-is
@@ -171,6 +206,81 @@ def sanitize_context(context: dict[str, Any], max_depth: int = 3) -> dict[str, A
     return sanitized
 
 
+def _context_cache_key(context: dict[str, Any], max_depth: int) -> tuple | None:
+    """
+    Build a hashable snapshot of a context for the sanitize_context cache.
+
+    Types are recorded alongside values so e.g. a tuple (passed through as-is) never
+    shares an entry with a list (sanitized). Returns None for contexts that should not
+    be cached: non-JSON types, subclasses, or lists longer than the sanitizer keeps.
+    """
+    if max_depth <= 0:
+        return ()  # Contents are discarded at this depth
+
+    items = []
+    for key, value in context.items():
+        value_type = type(value)
+        if value_type is dict:
+            frozen = _context_cache_key(value, max_depth - 1)
+            if frozen is None:
+                return None
+        elif value_type is list:
+            if len(value) > _MAX_CONTEXT_LIST_ITEMS or any(
+                type(item) not in _SCALAR_TYPES for item in value
+            ):
+                return None
+            frozen = tuple((type(item), item) for item in value)
+        elif value_type in _SCALAR_TYPES:
+            frozen = value
+        else:
+            return None
+        items.append((type(key), key, value_type, frozen))
+    return tuple(items)
+
+
+def sanitize_context(
+    context: dict[str, Any], max_depth: int = _DEFAULT_CONTEXT_DEPTH
+) -> dict[str, Any]:
+    """
+    Recursively sanitize a context dictionary.
+
+    Results for the default depth are memoized by content (LRU), since agent
+    flows re-sanitize the same context on every step.
+
+    Args:
+        context: Dictionary of context values
+        max_depth: Maximum nesting depth (prevents deep injection)
+
+    Returns:
+        Sanitized context dictionary
+    """
+    cache_key = None
+    if max_depth == _DEFAULT_CONTEXT_DEPTH:
+        cache_key = _context_cache_key(context, max_depth)
+    if cache_key is None:
+        return _sanitize_context(context, max_depth)
+
+    with _context_cache_lock:
+        cached = _context_cache.get(cache_key)
+        if cached is not None:
+            _context_cache.move_to_end(cache_key)
+    if cached is None:
+        # Injection errors propagate and are never cached
+        cached = _sanitize_context(context, max_depth)
+        with _context_cache_lock:
+            _context_cache[cache_key] = cached
+            if len(_context_cache) > CONTEXT_CACHE_MAX_ENTRIES:
+                _context_cache.popitem(last=False)
+    # Callers own their result; never hand out the cached dict itself
+    return copy.deepcopy(cached)
+
+
+def clear_context_cache() -> None:
+    """Drop all memoized sanitize_context results."""
+    with _context_cache_lock:
+        _context_cache.clear()
+
+
 def create_safe_user_message(goal: str, context: dict[str, Any]) -> str:
     """
     Create a safe user message for LLM prompts.
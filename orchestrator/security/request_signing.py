@@ -11,64 +11,82 @@ Toggle: ORCHESTRATOR_REQUIRE_SIGNATURE (default: true)
 Secret: ORCHESTRATOR_SHARED_SECRET (env only, never logged)
 """
 
+import base64
 import hashlib
 import hmac
 import os
-import re
 import time
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 
-# Paths that require signature verification
-_SIGNED_PATHS = {"/api/v1/goals"}
+# Path that requires signature verification (a plain string compare per request;
+# use a frozenset here if more paths ever need signing)
+_SIGNED_PATH = "/api/v1/goals"
 
 # Maximum allowed clock skew in seconds
 _MAX_TIMESTAMP_SKEW = 300
 
-# Base64 detection: contains only base64 chars and optionally padding
-_BASE64_RE = re.compile(r"^[A-Za-z0-9+/]+=*$")
+# Encoded lengths of a SHA-256 signature
+_HEX_SIG_LEN = 64
+_B64_SIG_LEN = 44
+
+# Settings read from the environment once, on first use (see _reset_secret_cache)
+_cached_secret: bytes | None = None
+_cached_signature_required: bool | None = None
+
+
+def _reset_secret_cache() -> None:
+    """Forget cached signing settings so they are re-read from the environment."""
+    global _cached_secret, _cached_signature_required
+    _cached_secret = None
+    _cached_signature_required = None
 
 
 def _is_signature_required() -> bool:
     """Check if signature verification is enabled via environment."""
-    env_val = os.environ.get("ORCHESTRATOR_REQUIRE_SIGNATURE", "").lower()
-    if env_val in ("true", "1", "yes"):
-        return True
+    global _cached_signature_required
 
-    # Default: enabled by default for secure-by-default behavior.
-    # To disable during local development, set ORCHESTRATOR_REQUIRE_SIGNATURE=false
-    return env_val not in ("false", "0", "no")
+    if _cached_signature_required is None:
+        env_val = os.environ.get("ORCHESTRATOR_REQUIRE_SIGNATURE", "").lower()
+        # Default: enabled by default for secure-by-default behavior.
+        # To disable during local development, set ORCHESTRATOR_REQUIRE_SIGNATURE=false
+        _cached_signature_required = env_val not in ("false", "0", "no")
+    return _cached_signature_required
 
 
 def _get_shared_secret() -> bytes:
     """Retrieve shared secret from environment."""
-    secret = os.environ.get("ORCHESTRATOR_SHARED_SECRET", "")
-    if not secret:
-        raise ValueError("ORCHESTRATOR_SHARED_SECRET not configured")
-    return secret.encode("utf-8")
+    global _cached_secret
+
+    if _cached_secret is None:
+        secret = os.environ.get("ORCHESTRATOR_SHARED_SECRET", "")
+        if not secret:
+            # Not cached, so a secret configured later is still picked up
+            raise ValueError("ORCHESTRATOR_SHARED_SECRET not configured")
+        _cached_secret = secret.encode("utf-8")
+    return _cached_secret
 
 
 def _decode_signature(sig_str: str) -> bytes:
     """Decode signature from hex or base64 format."""
-    # Try hex first (64 chars for SHA-256)
+    # SHA-256 is 64 chars as hex, 44 as padded base64 (43 unpadded), so the
+    # length alone selects the decoder; both decoders validate the charset
+    n = len(sig_str)
     try:
-        decoded = bytes.fromhex(sig_str)
-        if len(decoded) == 32:
-            return decoded
-    except ValueError:
-        pass
-    # Try base64
-    if _BASE64_RE.match(sig_str):
-        import base64
-
-        try:
-            decoded = base64.b64decode(sig_str)
-            if len(decoded) == 32:
-                return decoded
-        except Exception:  # noqa: S110 - intentional: invalid base64 falls through to error
-            pass
-    raise ValueError("Invalid signature format")
+        if n == _HEX_SIG_LEN:
+            decoded = bytes.fromhex(sig_str)
+        elif n == _B64_SIG_LEN:
+            decoded = base64.b64decode(sig_str, validate=True)
+        elif n == _B64_SIG_LEN - 1:
+            decoded = base64.b64decode(sig_str + "=", validate=True)
+        else:
+            decoded = b""
+    except ValueError:  # binascii.Error is a ValueError
+        decoded = b""
+    if len(decoded) != hashlib.sha256().digest_size:
+        raise ValueError("Invalid signature format")
+    return decoded
 
 
 def compute_signature(
@@ -84,9 +102,26 @@ def compute_signature(
 
     Returns raw bytes (caller decides hex/base64 encoding).
     """
-    body_hash = hashlib.sha256(body_raw).hexdigest()
-    canonical = f"{method}\n{path}\n{timestamp}\n{trace_id}\n{body_hash}"
-    return hmac.new(secret, canonical.encode("utf-8"), hashlib.sha256).digest()
+    # Feed the canonical string to the MAC piecewise instead of building it
+    mac = hmac.new(secret, digestmod=hashlib.sha256)
+    for part in (method, path, timestamp, trace_id):
+        mac.update(part.encode("utf-8"))
+        mac.update(b"\n")
+    mac.update(hashlib.sha256(body_raw).hexdigest().encode("ascii"))
+    return mac.digest()
+
+
+def _check_timestamp(timestamp_str: str) -> str | None:
+    """Return an error string if the timestamp is malformed or outside the allowed skew."""
+    try:
+        timestamp = int(timestamp_str)
+    except (ValueError, TypeError):
+        return "invalid_timestamp"
+
+    now = int(time.time())
+    if abs(now - timestamp) > _MAX_TIMESTAMP_SKEW:
+        return "timestamp_expired"
+    return None
 
 
 def verify_request(
@@ -101,14 +136,9 @@ def verify_request(
     Verify request signature. Returns None on success, error string on failure.
     """
     # Validate timestamp
-    try:
-        timestamp = int(timestamp_str)
-    except (ValueError, TypeError):
-        return "invalid_timestamp"
-
-    now = int(time.time())
-    if abs(now - timestamp) > _MAX_TIMESTAMP_SKEW:
-        return "timestamp_expired"
+    error = _check_timestamp(timestamp_str)
+    if error is not None:
+        return error
 
     # Get secret
     try:
@@ -116,15 +146,15 @@ def verify_request(
     except ValueError:
         return "server_config_error"
 
-    # Compute expected signature
-    expected = compute_signature(secret, method, path, timestamp_str, trace_id, body_raw)
-
-    # Decode provided signature
+    # Decode provided signature (before hashing the body, so malformed ones are cheap)
     try:
         provided = _decode_signature(signature_str)
     except ValueError:
         return "invalid_signature_format"
 
+    # Compute expected signature
+    expected = compute_signature(secret, method, path, timestamp_str, trace_id, body_raw)
+
     # Constant-time comparison
     if not hmac.compare_digest(expected, provided):
         return "signature_mismatch"
@@ -137,7 +167,7 @@ class SignatureVerificationMiddleware(BaseHTTPMiddleware):
 
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
         # Only verify signed paths with POST
-        if request.method != "POST" or request.url.path not in _SIGNED_PATHS:
+        if request.method != "POST" or request.url.path != _SIGNED_PATH:
             return await call_next(request)
 
         # Check if verification is enabled
@@ -149,7 +179,8 @@ class SignatureVerificationMiddleware(BaseHTTPMiddleware):
         trace_id = request.headers.get("X-Omni-Trace-Id")
         signature = request.headers.get("X-Omni-Signature")
 
-        if not timestamp or not trace_id or not signature:
+        # Reject stale requests before reading (and later hashing) the body
+        if not timestamp or not trace_id or not signature or _check_timestamp(timestamp):
             return Response(
                 content='{"error":"unauthorized"}',
                 status_code=401,
@@ -8,15 +8,39 @@ Provides URL validation to prevent SSRF attacks by checking:
 """
 
 import asyncio
+import functools
 import ipaddress
+import os
 import socket
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Any
 from urllib.parse import urlparse
 
+# Successful resolutions are reused for up to this long, so repeated checks of the
+# same host skip DNS (0 disables the cache)
+DNS_CACHE_TTL_SECONDS = float(os.environ.get("SSRF_DNS_CACHE_TTL_SECONDS", "60"))
+DNS_CACHE_MAX_ENTRIES = 1024
+IP_VERDICT_CACHE_MAX_ENTRIES = 4096
+
+# hostname -> (expires_at, getaddrinfo results), least recently used first
+_dns_cache: OrderedDict[str, tuple[float, tuple[Any, ...]]] = OrderedDict()
+_dns_cache_lock = threading.Lock()
+
+# Accepted URL -> expires_at, least recently used first. A verdict expires with the DNS
+# cache entry it was checked against (IP literals: DNS_CACHE_TTL_SECONDS after the
+# check), so it never outlives that resolution. Blocked URLs are not cached.
+URL_VERDICT_CACHE_MAX_ENTRIES = 1024
+_url_verdict_cache: OrderedDict[str, float] = OrderedDict()
+
 
 async def validate_url_async(url: str) -> str:
     """
     Asynchronously validate URL to prevent SSRF attacks.
-    Runs DNS resolution in a thread executor to avoid blocking the event loop.
+    Only DNS resolution leaves the event loop (via loop.getaddrinfo); parsing and
+    IP checks run inline, and cached resolutions need no executor hop at all.
 
     Args:
         url: The URL to validate.
@@ -27,8 +51,30 @@ async def validate_url_async(url: str) -> str:
     Raises:
         ValueError: If the URL is invalid or points to a restricted IP.
     """
-    loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(None, validate_url, url)
+    _require_url_string(url)
+    if _url_verdict_cached(url):
+        return url
+
+    hostname = _parse_hostname(url)
+    if _check_literal(hostname):
+        _cache_url_verdict(url)
+        return url
+
+    entry = _dns_cache_get(hostname)
+    if entry is None:
+        loop = asyncio.get_running_loop()
+        try:
+            # NOSONAR: DNS lookup is required for SSRF validation
+            addr_infos = await loop.getaddrinfo(hostname, None)
+        except socket.gaierror as e:
+            raise ValueError(f"Could not resolve hostname {hostname}: {e}") from e
+        expires_at = _dns_cache_put(hostname, addr_infos)
+    else:
+        expires_at, addr_infos = entry
+
+    _check_resolved(hostname, addr_infos)
+    _cache_url_verdict(url, expires_at)
+    return url
 
 
 def validate_url(url: str) -> str:
@@ -44,9 +90,56 @@ def validate_url(url: str) -> str:
     Raises:
         ValueError: If the URL is invalid or points to a restricted IP.
     """
+    _require_url_string(url)
+    if _url_verdict_cached(url):
+        return url
+
+    hostname = _parse_hostname(url)
+    if _check_literal(hostname):
+        _cache_url_verdict(url)
+        return url
+
+    # Resolve hostname to IP(s)
+    entry = _dns_cache_get(hostname)
+    if entry is None:
+        try:
+            # getaddrinfo returns a list of (family, type, proto, canonname, sockaddr)
+            # We only care about the sockaddr (IP)
+            # Use AI_ADDRCONFIG to filter out IPv6 if system doesn't support it, but
+            # for security, we want to see ALL resolutions.
+            # NOSONAR: DNS lookup is required for SSRF validation
+            addr_infos = socket.getaddrinfo(hostname, None)
+        except socket.gaierror as e:
+            raise ValueError(f"Could not resolve hostname {hostname}: {e}") from e
+        expires_at = _dns_cache_put(hostname, addr_infos)
+    else:
+        expires_at, addr_infos = entry
+
+    _check_resolved(hostname, addr_infos)
+    _cache_url_verdict(url, expires_at)
+    return url
+
+
+def _require_url_string(url: Any) -> None:
+    """
+    Reject empty and non-string input before it reaches the verdict cache.
+
+    Raises:
+        ValueError: If the URL is empty or not a string (e.g. a list from activity params).
+    """
     if not url:
         raise ValueError("URL cannot be empty")
+    if not isinstance(url, str):
+        raise ValueError(f"Invalid URL format: expected a string, got {type(url).__name__}")
+
+
+def _parse_hostname(url: str) -> str:
+    """
+    Check the URL's scheme and return its hostname.
 
+    Raises:
+        ValueError: If the URL is malformed, not http(s), or has no hostname.
+    """
     try:
         parsed = urlparse(url)
     except Exception as e:
@@ -59,29 +152,43 @@ def validate_url(url: str) -> str:
     if not hostname:
         # urlparse might return empty hostname if scheme is missing or malformed
         raise ValueError("URL must have a hostname")
+    return hostname
+
+
+def _check_literal(hostname: str) -> bool:
+    """
+    Check an IP-literal hostname (e.g., [::1] or 127.0.0.1) without DNS.
+
+    Returns:
+        True if the hostname is an allowed IP literal, False if it needs resolving.
+
+    Raises:
+        ValueError: If the hostname is an IP literal in a restricted range.
+    """
+    # IPv4 literals start with a digit and IPv6 literals contain ":", so typical DNS
+    # names skip the parse attempt (and its raised ValueError) entirely
+    if not (hostname[0].isdigit() or ":" in hostname or hostname[0] == "["):
+        return False
 
-    # Check for IP literal in hostname (e.g., [::1] or 127.0.0.1)
     try:
         # Strip brackets for IPv6 literals
         ip_obj = ipaddress.ip_address(hostname.strip("[]"))
-        _check_ip(ip_obj)
-        # If it's an IP literal and passes checks, it's safe.
-        return url
     except ValueError:
         # Not an IP literal, proceed to resolution
-        pass
+        return False
 
-    # Resolve hostname to IP(s)
-    try:
-        # getaddrinfo returns a list of (family, type, proto, canonname, sockaddr)
-        # We only care about the sockaddr (IP)
-        # Use AI_ADDRCONFIG to filter out IPv6 if system doesn't support it, but
-        # for security, we want to see ALL resolutions.
-        # NOSONAR: DNS lookup is required for SSRF validation
-        addr_infos = socket.getaddrinfo(hostname, None)
-    except socket.gaierror as e:
-        raise ValueError(f"Could not resolve hostname {hostname}: {e}") from e
+    # Literals never need DNS: pass or fail here, without a getaddrinfo call
+    _check_ip(ip_obj)
+    return True
 
+
+def _check_resolved(hostname: str, addr_infos: Sequence[Any]) -> None:
+    """
+    Check every address a hostname resolved to.
+
+    Raises:
+        ValueError: If there are no addresses or any of them is restricted.
+    """
     if not addr_infos:
         raise ValueError(f"No IP addresses found for hostname {hostname}")
 
@@ -99,7 +206,68 @@ def validate_url(url: str) -> str:
             # Re-raise with context if check fails
             raise ValueError(f"Resolved IP {ip_str} for {hostname} is blocked: {e}") from e
 
-    return url
+
+def _dns_cache_get(hostname: str) -> tuple[float, tuple[Any, ...]] | None:
+    """Return (expires_at, getaddrinfo results) for hostname, or None if absent or expired."""
+    if DNS_CACHE_TTL_SECONDS <= 0:
+        return None
+    with _dns_cache_lock:
+        entry = _dns_cache.get(hostname)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry[0]:
+            del _dns_cache[hostname]
+            return None
+        _dns_cache.move_to_end(hostname)
+        return entry
+
+
+def _dns_cache_put(hostname: str, addr_infos: Sequence[Any]) -> float:
+    """Cache a successful resolution (empty results are not cached); return its expiry."""
+    expires_at = time.monotonic() + DNS_CACHE_TTL_SECONDS
+    if DNS_CACHE_TTL_SECONDS <= 0 or not addr_infos:
+        return expires_at
+    with _dns_cache_lock:
+        _dns_cache[hostname] = (expires_at, tuple(addr_infos))
+        _dns_cache.move_to_end(hostname)
+        if len(_dns_cache) > DNS_CACHE_MAX_ENTRIES:
+            _dns_cache.popitem(last=False)
+    return expires_at
+
+
+def _url_verdict_cached(url: str) -> bool:
+    """Return True if url passed validation within the cache TTL."""
+    if DNS_CACHE_TTL_SECONDS <= 0:
+        return False
+    with _dns_cache_lock:
+        expires_at = _url_verdict_cache.get(url)
+        if expires_at is None:
+            return False
+        if time.monotonic() >= expires_at:
+            del _url_verdict_cache[url]
+            return False
+        _url_verdict_cache.move_to_end(url)
+        return True
+
+
+def _cache_url_verdict(url: str, expires_at: float | None = None) -> None:
+    """Remember that url passed validation, until expires_at (default: one TTL from now)."""
+    if DNS_CACHE_TTL_SECONDS <= 0:
+        return
+    if expires_at is None:
+        expires_at = time.monotonic() + DNS_CACHE_TTL_SECONDS
+    with _dns_cache_lock:
+        _url_verdict_cache[url] = expires_at
+        _url_verdict_cache.move_to_end(url)
+        if len(_url_verdict_cache) > URL_VERDICT_CACHE_MAX_ENTRIES:
+            _url_verdict_cache.popitem(last=False)
+
+
+def clear_dns_cache() -> None:
+    """Drop all cached resolutions and URL verdicts."""
+    with _dns_cache_lock:
+        _dns_cache.clear()
+        _url_verdict_cache.clear()
 
 
 def _check_ip(ip: ipaddress.IPv4Address | ipaddress.IPv6Address) -> None:
@@ -109,20 +277,34 @@ def _check_ip(ip: ipaddress.IPv4Address | ipaddress.IPv6Address) -> None:
     Raises:
         ValueError: If IP is in a restricted range.
     """
+    reason = _blocked_reason(ip)
+    if reason is not None:
+        raise ValueError(reason)
+
+
+@functools.lru_cache(maxsize=IP_VERDICT_CACHE_MAX_ENTRIES)
+def _blocked_reason(ip: ipaddress.IPv4Address | ipaddress.IPv6Address) -> str | None:
+    """
+    Return why an IP address is restricted, or None if it is allowed.
+
+    Memoized per address: resolved hosts keep returning the same few IPs, and each
+    ipaddress range property below scans a table of networks.
+    """
     if ip.is_unspecified:
-        raise ValueError(f"Unspecified address {ip} is not allowed")
+        return f"Unspecified address {ip} is not allowed"
     if ip.is_loopback:
-        raise ValueError(f"Loopback address {ip} is not allowed")
+        return f"Loopback address {ip} is not allowed"
     if ip.is_link_local:
-        raise ValueError(f"Link-local address {ip} is not allowed")
+        return f"Link-local address {ip} is not allowed"
     if ip.is_multicast:
-        raise ValueError(f"Multicast address {ip} is not allowed")
+        return f"Multicast address {ip} is not allowed"
     if ip.is_reserved:
-        raise ValueError(f"Reserved address {ip} is not allowed")
+        return f"Reserved address {ip} is not allowed"
     if ip.is_private:
-        raise ValueError(f"Private address {ip} is not allowed")
+        return f"Private address {ip} is not allowed"
 
     # Specific checks for IPv6 (some might be covered by above, but being explicit is safer)
     if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped:
         # IPv4-mapped IPv6 addresses (::ffff:127.0.0.1) should also be checked against IPv4 rules
-        _check_ip(ip.ipv4_mapped)
+        return _blocked_reason(ip.ipv4_mapped)
+    return None
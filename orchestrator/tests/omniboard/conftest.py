@@ -0,0 +1,18 @@
+"""Shared fixtures for OmniBoard tests."""
+
+from collections.abc import Generator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from omniboard.router import router
+
+
+@pytest.fixture(scope="session")
+def client() -> Generator[TestClient, None, None]:
+    """TestClient for the OmniBoard router, shared across the session."""
+    app = FastAPI()
+    app.include_router(router)
+    with TestClient(app) as test_client:
+        yield test_client
@@ -62,21 +62,21 @@ def test_fsm_failure_recovery():
     # Jump to verify
     context.state = OmniBoardState.VERIFY_CONNECTION
 
+    # One event reused for every attempt: transition must not mutate it
+    fail_event = FSMEvent(event_type="VERIFICATION_RESULT", payload={"verified": False})
+
     # Fail 3 times
     for _ in range(3):
-        context, _ = OmniBoardFSM.transition(
-            context, FSMEvent(event_type="VERIFICATION_RESULT", payload={"verified": False})
-        )
+        context, _ = OmniBoardFSM.transition(context, fail_event)
         assert context.state == OmniBoardState.AUTH_SETUP
         # Manually push back to verify for test
         context.state = OmniBoardState.VERIFY_CONNECTION
 
     # 4th failure -> RECOVERY_RETRY
-    context, msg = OmniBoardFSM.transition(
-        context, FSMEvent(event_type="VERIFICATION_RESULT", payload={"verified": False})
-    )
+    context, msg = OmniBoardFSM.transition(context, fail_event)
     assert context.state == OmniBoardState.RECOVERY_RETRY
     assert "start over" in msg.lower()
+    assert fail_event.payload == {"verified": False}
 
 
 def test_fsm_disambiguation():
@@ -1,15 +1,4 @@
-from fastapi import FastAPI
-from fastapi.testclient import TestClient
-
-from omniboard.router import router
-
-app = FastAPI()
-app.include_router(router)
-
-client = TestClient(app)
-
-
-def test_router_lifecycle():
+def test_router_lifecycle(client):
     """Verify disconnect and rotate endpoints."""
     # these are mock endpoints, just checking 200 OK
 
@@ -1,50 +1,60 @@
 """Tests for activity security."""
 
 import sys
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-
-@pytest.fixture
-def mock_dependencies():
-    """Mock heavy dependencies using patch.dict to avoid global pollution."""
-    mock_redis = MagicMock()
-
-    modules = {
-        "redis": mock_redis,
-        "redis.asyncio": MagicMock(),
-        "redis.commands": MagicMock(),
-        "redis.commands.search": MagicMock(),
-        "redis.commands.search.field": MagicMock(),
-        "redis.commands.search.query": MagicMock(),
-        "redis.commands.search.index": MagicMock(),
-        "sentence_transformers": MagicMock(),
-        "instructor": MagicMock(),
-        "litellm": MagicMock(),
-        "supabase": MagicMock(),
-        "numpy": MagicMock(),
-    }
+# Heavy dependencies of activities.tools, replaced by MagicMocks
+_MOCKED_MODULES = (
+    "redis",
+    "redis.asyncio",
+    "redis.commands",
+    "redis.commands.search",
+    "redis.commands.search.field",
+    "redis.commands.search.query",
+    "redis.commands.search.index",
+    "sentence_transformers",
+    "instructor",
+    "litellm",
+    "supabase",
+    "numpy",
+)
+
+
+@pytest.fixture(scope="module")
+def mocked_tools():
+    """
+    Import activities.tools with heavy dependencies mocked via patch.dict (no global pollution).
+
+    Installed once per module, so activities.tools is imported once rather than per test.
+    """
+    modules = {name: MagicMock() for name in _MOCKED_MODULES}
 
     # Ensure activities.tools is re-imported with mocks
-    if "activities.tools" in sys.modules:
-        del sys.modules["activities.tools"]
+    sys.modules.pop("activities.tools", None)
 
     with patch.dict(sys.modules, modules):
-        yield
+        import activities.tools
+
+        yield activities.tools
 
     # Cleanup: remove activities.tools so subsequent tests re-import it with real deps
-    if "activities.tools" in sys.modules:
-        del sys.modules["activities.tools"]
+    sys.modules.pop("activities.tools", None)
+
+
+@pytest.fixture
+async def tools(mocked_tools):
+    """The mocked activities.tools, with no webhook client left over from other tests."""
+    await mocked_tools.aclose_webhook_client()
+    yield mocked_tools
+    await mocked_tools.aclose_webhook_client()
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("mock_dependencies")
-async def test_call_webhook_ssrf_blocked():
+async def test_call_webhook_ssrf_blocked(tools):
     """Test that call_webhook blocks SSRF attempts."""
 
-    from activities.tools import call_webhook
-
     # We patch httpx.AsyncClient to ensure it's NOT called.
     with patch("httpx.AsyncClient") as mock_client_cls:
         params = {
@@ -52,7 +62,7 @@ async def test_call_webhook_ssrf_blocked():
             "method": "GET",
         }
 
-        result = await call_webhook(params)
+        result = await tools.call_webhook(params)
 
         assert result["success"] is False
         assert result["status_code"] == 403
@@ -63,15 +73,14 @@ async def test_call_webhook_ssrf_blocked():
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("mock_dependencies")
-async def test_call_webhook_valid_url():
+async def test_call_webhook_valid_url(tools):
     """Test that call_webhook allows valid URLs."""
 
-    from activities.tools import call_webhook
-
     with patch("httpx.AsyncClient") as mock_client_cls:
-        mock_client = mock_client_cls.return_value.__aenter__.return_value
-        mock_client.request.return_value = MagicMock(status_code=200, text="OK")
+        mock_client = mock_client_cls.return_value
+        mock_client.is_closed = False
+        mock_client.aclose = AsyncMock()
+        mock_client.request = AsyncMock(return_value=MagicMock(status_code=200, text="OK"))
 
         # Mock DNS resolution
         with patch("socket.getaddrinfo") as mock_getaddrinfo:
@@ -84,10 +93,51 @@ async def test_call_webhook_valid_url():
                 "method": "POST",
             }
 
-            result = await call_webhook(params)
+            result = await tools.call_webhook(params)
 
             assert result["success"] is True
             assert result["status_code"] == 200
 
             # Verify httpx WAS called
             mock_client.request.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_call_webhook_reuses_client(tools):
+    """Test that consecutive webhook calls share one pooled client."""
+
+    with patch("httpx.AsyncClient") as mock_client_cls:
+        mock_client = mock_client_cls.return_value
+        mock_client.is_closed = False
+        mock_client.aclose = AsyncMock()
+        mock_client.request = AsyncMock(return_value=MagicMock(status_code=200, text="OK"))
+
+        with patch("socket.getaddrinfo") as mock_getaddrinfo:
+            mock_getaddrinfo.return_value = [
+                (2, 1, 6, "", ("93.184.216.34", 80))  # NOSONAR
+            ]
+
+            for _ in range(2):
+                await tools.call_webhook({"url": "http://example.com/webhook"})  # NOSONAR
+
+        mock_client_cls.assert_called_once()
+        assert mock_client.request.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_aclose_webhook_client_closes_pool(tools):
+    """Test that closing the pooled client releases it and a later call reopens one."""
+
+    with patch("httpx.AsyncClient") as mock_client_cls:
+        mock_client = mock_client_cls.return_value
+        mock_client.is_closed = False
+        mock_client.aclose = AsyncMock()
+
+        tools._get_webhook_client()
+        await tools.aclose_webhook_client()
+
+        mock_client.aclose.assert_awaited_once()
+        assert tools._webhook_client is None
+
+        tools._get_webhook_client()
+        assert mock_client_cls.call_count == 2
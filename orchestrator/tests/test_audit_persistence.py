@@ -6,7 +6,7 @@ Ensures audit events are never silently lost.
 
 from datetime import UTC, datetime
 from io import StringIO
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -88,6 +88,24 @@ class TestAuditPersistence:
             assert sample_event.id in stderr_output
             assert "data_access" in stderr_output
 
+    @pytest.mark.asyncio
+    async def test_fallback_written_in_one_call(self, audit_logger, sample_event):
+        """Both fallback lines should reach stderr in a single write."""
+        mock_db = AsyncMock()
+        mock_db.insert = AsyncMock(side_effect=Exception("DB connection failed"))
+        mock_stderr = MagicMock()
+
+        with (
+            patch("models.audit.get_database_provider", return_value=mock_db),
+            patch("sys.stderr", mock_stderr),
+        ):
+            await audit_logger._store_supabase(sample_event)
+
+        mock_stderr.write.assert_called_once()
+        lines = mock_stderr.write.call_args[0][0].splitlines()
+        assert lines[0].startswith("CRITICAL: Audit persistence failed")
+        assert lines[1].startswith("AUDIT_FALLBACK")
+
     @pytest.mark.asyncio
     async def test_fallback_does_not_log_secrets(self, audit_logger, sample_event):
         """Fallback should not log sensitive data."""
@@ -173,3 +191,23 @@ class TestAuditLoggerIntegration:
             assert result_id == event.id
             assert event.processed_at is not None
             assert event.integrity_hash is not None
+
+    @pytest.mark.asyncio
+    async def test_unsupported_backend_rejected_on_log(self):
+        """Unknown backends should fail when an event is logged, not at construction."""
+        logger = AuditLogger(storage_backend="external")
+
+        event = AuditLogEntry(
+            id="int-test-456",
+            correlation_id="corr-789",
+            timestamp=datetime.now(UTC),
+            event_sequence=1,
+            actor_id="user-789",
+            action=AuditAction.LOGIN,
+            status=AuditStatus.SUCCESS,
+            resource_type=AuditResourceType.USER,
+            resource_id="user-789",
+        )
+
+        with pytest.raises(ValueError, match="Unsupported storage backend: external"):
+            await logger.log_event(event)
@@ -1,9 +1,14 @@
 """Unit tests for semantic caching with Redis."""
 
+import asyncio
 import os
+import threading
+import time
 
+import numpy as np
 import pytest
 
+import infrastructure.cache as cache_module
 from infrastructure.cache import EntityExtractor, SemanticCacheService
 
 
@@ -42,6 +47,53 @@ class TestEntityExtractor:
         assert "AMOUNT" in entities
         assert "$1,500" in entities["AMOUNT"]
 
+    def test_email_pattern_linear_on_dotted_input(self):
+        """Dotted runs without an address should not trigger regex backtracking."""
+        start = time.perf_counter()
+        entities = EntityExtractor.extract_entities("a." * 5000)
+        duration = time.perf_counter() - start
+
+        assert "EMAIL" not in entities
+        assert duration < 0.2, f"Extraction took {duration:.3f}s"
+
+    def test_extraction_memoized_with_fresh_results(self):
+        """Repeat texts should hit the cache but never share mutable results."""
+        EntityExtractor._reset_memos()
+        text = "Book flight to Paris tomorrow"
+
+        first = EntityExtractor.extract_entities(text)
+        first["DATE"].append("mutated")
+        assert EntityExtractor.extract_entities(text)["DATE"] == ["tomorrow"]
+        assert EntityExtractor._entities_memo.cache_info().hits == 1
+
+        _, params = EntityExtractor.create_template(text)
+        params.clear()
+        assert EntityExtractor.create_template(text)[1]
+        assert EntityExtractor._template_memo.cache_info().hits == 1
+
+    def test_subclass_patterns_used(self):
+        """Subclasses overriding PATTERNS should extract with their own patterns."""
+
+        class TicketExtractor(EntityExtractor):
+            PATTERNS = {"TICKET": [r"\bTKT-\d+\b"]}
+
+        text = "Escalate TKT-42 to Paris"
+        assert TicketExtractor.extract_entities(text) == {"TICKET": ["TKT-42"]}
+        assert "TICKET" not in EntityExtractor.extract_entities(text)
+        assert TicketExtractor._entities_memo is not EntityExtractor._entities_memo
+
+    def test_create_template_uses_overridden_extract_entities(self):
+        """create_template should build from a subclass's extract_entities override."""
+
+        class FixedExtractor(EntityExtractor):
+            @classmethod
+            def extract_entities(cls, text):
+                return {"CITY": [word for word in text.split() if word == "Paris"]}
+
+        template, params = FixedExtractor.create_template("Fly to Paris tomorrow")
+        assert template == "Fly to {CITY} tomorrow"
+        assert params == {"CITY": "Paris"}
+
     def test_create_template(self):
         """Should convert goal into parameterized template."""
         text = "Book flight to Paris tomorrow"
@@ -65,6 +117,96 @@ class TestEntityExtractor:
         assert "EMAIL" in params or "AMOUNT" in params
 
 
+class _FakeEncoder:
+    """Stand-in for SentenceTransformer that records each encode batch."""
+
+    def __init__(self, _model_name: str):
+        self.batches: list[list[str]] = []
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return 3
+
+    def encode(self, texts: list[str], **_kwargs) -> np.ndarray:
+        self.batches.append(list(texts))
+        return np.array([[len(text), 1.0, 0.5] for text in texts], dtype=np.float64)
+
+
+class TestEmbeddingCache:
+    """Test reuse and batching of template embeddings."""
+
+    @pytest.fixture
+    async def service(self, monkeypatch):
+        monkeypatch.setattr(cache_module, "SentenceTransformer", _FakeEncoder)
+        service = SemanticCacheService(redis_url="redis://unused")
+        yield service
+        await service.close()
+
+    async def test_repeat_template_skips_model(self, service):
+        first = await service._embed_template("Book flight to {LOCATION}")
+        second = await service._embed_template("Book flight to {LOCATION}")
+
+        assert service.embedding_model.batches == [["Book flight to {LOCATION}"]]
+        assert second is first
+        assert first.dtype == np.float32
+        assert not first.flags.writeable
+
+    async def test_evicts_least_recently_used(self, service, monkeypatch):
+        monkeypatch.setattr(cache_module, "EMBEDDING_CACHE_MAX_ENTRIES", 2)
+        for text in ("a", "b", "a", "c"):
+            await service._embed_template(text)
+
+        assert list(service._embedding_cache) == ["a", "c"]
+
+    async def test_concurrent_misses_share_one_batch(self, service):
+        texts = ["a", "bb", "a", "ccc"]
+        embeddings = await asyncio.gather(*(service._embed_template(t) for t in texts))
+
+        assert service.embedding_model.batches == [["a", "bb", "ccc"]]
+        assert [e[0] for e in embeddings] == [1.0, 2.0, 1.0, 3.0]
+
+    async def test_batch_size_capped(self, service, monkeypatch):
+        monkeypatch.setattr(cache_module, "EMBED_BATCH_MAX_SIZE", 2)
+        await asyncio.gather(*(service._embed_template(t) for t in ("a", "b", "c")))
+
+        assert [len(batch) for batch in service.embedding_model.batches] == [2, 1]
+
+    async def test_encode_failure_reaches_callers(self, service, monkeypatch):
+        def fail(*_args, **_kwargs):
+            raise RuntimeError("model unavailable")
+
+        monkeypatch.setattr(service.embedding_model, "encode", fail)
+        with pytest.raises(RuntimeError, match="model unavailable"):
+            await service._embed_template("a")
+
+    async def test_close_fails_in_flight_and_queued_callers(self, service, monkeypatch):
+        monkeypatch.setattr(cache_module, "EMBED_BATCH_MAX_SIZE", 1)
+        started, release = threading.Event(), threading.Event()
+
+        def blocking_encode(texts, **_kwargs):
+            started.set()
+            release.wait(5)
+            return np.ones((len(texts), 3))
+
+        monkeypatch.setattr(service.embedding_model, "encode", blocking_encode)
+        in_flight = asyncio.create_task(service._embed_template("a"))
+        queued = asyncio.create_task(service._embed_template("b"))
+        try:
+            assert await asyncio.to_thread(started.wait, 5)
+            await service.close()
+
+            for caller in (in_flight, queued):
+                with pytest.raises(RuntimeError, match="worker stopped"):
+                    await asyncio.wait_for(caller, 1)
+        finally:
+            release.set()
+
+
+async def _force_expire(cache_service: SemanticCacheService, template_id: str) -> None:
+    """Shrink a cached plan's TTL to 1ms and wait just past it."""
+    await cache_service.redis.pexpire(f"plan:{template_id}", 1)
+    await asyncio.sleep(0.01)
+
+
 @pytest.mark.asyncio
 class TestSemanticCacheService:
     """Test semantic cache with vector similarity search."""
@@ -164,16 +306,15 @@ class TestSemanticCacheService:
         goal = "Test expiration"
         plan_steps = [{"id": "step1", "tool": "test"}]
 
-        await cache_service.store_plan(goal, plan_steps, ttl_seconds=1)
+        template_id = await cache_service.store_plan(goal, plan_steps, ttl_seconds=1)
 
         # Immediate retrieval should hit
         cached = await cache_service.get_plan(goal)
         assert cached is not None
 
-        # Wait for expiration
-        import asyncio
-
-        await asyncio.sleep(2)
+        # The 1s TTL was applied; expire the entry now instead of waiting it out
+        assert 0 < await cache_service.redis.pttl(f"plan:{template_id}") <= 1000
+        await _force_expire(cache_service, template_id)
 
         # Should miss cache after TTL
         cached_after = await cache_service.get_plan(goal)
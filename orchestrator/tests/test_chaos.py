@@ -13,10 +13,13 @@ Target: >95% success rate under chaos conditions.
 
 import asyncio
 import random
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from pydantic import ValidationError
 
 from infrastructure.cache import EntityExtractor, SemanticCacheService
 from models.events import (
@@ -39,16 +42,25 @@ class ChaosInjector:
     Uses seeded RNG for reproducibility (like sim/chaos-engine.ts).
     """
 
-    def __init__(self, seed: int = 42, failure_rate: float = 0.3):
+    __slots__ = ("rng", "failure_rate", "sleep")
+
+    def __init__(
+        self,
+        seed: int = 42,
+        failure_rate: float = 0.3,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
         """
         Initialize chaos injector.
 
         Args:
             seed: Random seed for reproducibility
             failure_rate: Probability of injecting failure (0-1)
+            sleep: Coroutine used for injected delays (e.g., VirtualClock.sleep)
         """
         self.rng = random.Random(seed)
         self.failure_rate = failure_rate
+        self.sleep = sleep
 
     def should_fail(self) -> bool:
         """Decide if this operation should fail."""
@@ -58,7 +70,7 @@ class ChaosInjector:
         """Inject random network delay."""
         if self.should_fail():
             delay_ms = self.rng.randint(min_ms, max_ms)
-            await asyncio.sleep(delay_ms / 1000.0)
+            await self.sleep(delay_ms / 1000.0)
 
     def corrupt_payload(self, payload: dict[str, Any]) -> dict[str, Any]:
         """Randomly corrupt payload data."""
@@ -90,6 +102,48 @@ class ChaosInjector:
         return self.rng.choice(errors)
 
 
+# Inputs that extraction must survive; built once rather than on every run
+_MALFORMED_INPUTS = (
+    "",  # Empty string
+    "  ",  # Whitespace only
+    "a" * 10000,  # Very long string
+    "🚀" * 100,  # Unicode spam
+    "SELECT * FROM users; DROP TABLE",  # SQL injection attempt
+)
+
+# Event type -> field copied into replay state (other event types leave state unchanged)
+_REPLAY_FIELDS: dict[type, str] = {
+    GoalReceived: "goal",
+    PlanGenerated: "plan_id",
+}
+
+
+def replay_events(events: list[Any]) -> dict[str, Any]:
+    """Fold events into workflow state, dispatching on exact event type."""
+    state: dict[str, Any] = {}
+    for event in events:
+        field = _REPLAY_FIELDS.get(type(event))
+        if field is not None:
+            state[field] = getattr(event, field)
+    return state
+
+
+class VirtualClock:
+    """
+    Stand-in for asyncio.sleep that records delays instead of waiting them out.
+
+    Each sleep still yields to the event loop, so concurrent tasks interleave
+    as they would around a real delay.
+    """
+
+    def __init__(self) -> None:
+        self.elapsed = 0.0
+
+    async def sleep(self, seconds: float) -> None:
+        self.elapsed += seconds
+        await asyncio.sleep(0)
+
+
 # ============================================================================
 # CHAOS TESTS
 # ============================================================================
@@ -101,37 +155,29 @@ class TestChaosEntityExtraction:
     def test_malformed_input(self):
         """Should handle malformed input gracefully."""
         # ChaosInjector not needed for this deterministic test
-        test_cases = [
-            "",  # Empty string
-            "  ",  # Whitespace only
-            "a" * 10000,  # Very long string
-            "🚀" * 100,  # Unicode spam
-            "SELECT * FROM users; DROP TABLE",  # SQL injection attempt
-        ]
-
-        for malformed in test_cases:
+        for malformed in _MALFORMED_INPUTS:
             # Should not crash
             entities = EntityExtractor.extract_entities(malformed)
             assert isinstance(entities, dict)
 
     def test_concurrent_extraction(self):
         """Should handle concurrent extraction without race conditions."""
+        goals = [
+            "Book flight to Paris tomorrow",
+            "Send email to john@example.com",
+            "Transfer $500 to account",
+        ] * 10
 
-        async def extract_concurrent():
-            goals = [
-                "Book flight to Paris tomorrow",
-                "Send email to john@example.com",
-                "Transfer $500 to account",
-            ] * 10
-
-            tasks = [asyncio.to_thread(EntityExtractor.extract_entities, goal) for goal in goals]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Extraction is synchronous, so worker threads hit it directly (no event loop)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(EntityExtractor.extract_entities, goals))
 
-            # All should succeed (no exceptions)
-            errors = [r for r in results if isinstance(r, Exception)]
-            assert len(errors) == 0, f"Concurrent extraction had {len(errors)} errors"
+        # All should succeed (map re-raises any error) and match a sequential run
+        def normalized(entities: dict[str, list[str]]) -> dict[str, list[str]]:
+            return {k: sorted(v) for k, v in entities.items()}
 
-        asyncio.run(extract_concurrent())
+        expected = [normalized(EntityExtractor.extract_entities(goal)) for goal in goals]
+        assert [normalized(entities) for entities in results] == expected
 
     def test_template_extraction_stability(self):
         """Template extraction should be deterministic."""
@@ -183,8 +229,6 @@ class TestChaosSchemaValidation:
 
     def test_type_coercion_attacks(self):
         """Should reject type coercion attacks."""
-        from pydantic import ValidationError
-
         # Each attack has one invalid field type
         attacks = [
             {
@@ -213,10 +257,35 @@ class TestChaosSchemaValidation:
 class TestChaosSemanticCache:
     """Test semantic cache under chaos conditions."""
 
+    @pytest.fixture(autouse=True)
+    async def eager_tasks(self):
+        """
+        Start gathered tasks eagerly (Python 3.12+), so the many that finish without
+        suspending skip a loop round-trip. No-op on older interpreters.
+        """
+        eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_task_factory is None:
+            yield
+            return
+
+        loop = asyncio.get_running_loop()
+        previous = loop.get_task_factory()
+        loop.set_task_factory(eager_task_factory)
+        try:
+            yield
+        finally:
+            loop.set_task_factory(previous)
+
+    @pytest.fixture(scope="session")
+    def mock_cache_template(self):
+        """Build the spec'd mock once; specing walks SemanticCacheService each time."""
+        return MagicMock(spec=SemanticCacheService)
+
     @pytest.fixture
-    async def mock_cache(self):
+    def mock_cache(self, mock_cache_template):
         """Create mock cache for testing without Redis."""
-        cache = MagicMock(spec=SemanticCacheService)
+        cache = mock_cache_template
+        cache.reset_mock(return_value=True, side_effect=True)
         cache.similarity_threshold = 0.85
         cache.get_plan = AsyncMock(return_value=None)
         cache.store_plan = AsyncMock(return_value="template_123")
@@ -250,28 +319,35 @@ class TestChaosSemanticCache:
 
     async def test_cache_concurrent_writes(self, mock_cache):
         """Should handle concurrent cache writes without corruption."""
-        chaos = ChaosInjector(seed=42, failure_rate=0.2)
+        clock = VirtualClock()
+        chaos = ChaosInjector(seed=42, failure_rate=0.2, sleep=clock.sleep)
 
         async def store_with_delay(goal: str, plan: list):
             await chaos.inject_delay(10, 100)
             return await mock_cache.store_plan(goal, plan)
 
-        # Concurrent writes
-        goals = [f"Goal {i}" for i in range(50)]
-        plans = [[{"step": i}] for i in range(50)]
+        # Concurrent writes, each goal/plan pair built as its write is scheduled
+        write_count = 50
+        writes = [store_with_delay(f"Goal {i}", [{"step": i}]) for i in range(write_count)]
 
-        tasks = [store_with_delay(g, p) for g, p in zip(goals, plans, strict=True)]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Tally failures as writes finish rather than collecting every result first
+        errors = 0
+        for write in asyncio.as_completed(writes):
+            try:
+                await write
+            except Exception:
+                errors += 1
 
         # Most should succeed
-        errors = [r for r in results if isinstance(r, Exception)]
-        error_rate = len(errors) / len(results)
+        error_rate = errors / write_count
 
         assert error_rate < 0.3, f"Too many concurrent write errors: {error_rate:.2%}"
+        assert clock.elapsed > 0  # Delays were injected (virtually)
 
     async def test_cache_ttl_expiration_under_load(self, mock_cache):
         """TTL should work correctly under high load."""
-        chaos = ChaosInjector(seed=42, failure_rate=0.1)
+        clock = VirtualClock()
+        chaos = ChaosInjector(seed=42, failure_rate=0.1, sleep=clock.sleep)
 
         # Simulate rapid cache operations
         for _ in range(100):
@@ -300,19 +376,10 @@ class TestChaosWorkflowResilience:
         ]
 
         # Replay 10 times
-        states = []
-        for _ in range(10):
-            state = {}
-            for event in events:
-                if isinstance(event, GoalReceived):
-                    state["goal"] = event.goal
-                elif isinstance(event, PlanGenerated):
-                    state["plan_id"] = event.plan_id
-
-            states.append(str(state))
+        states = {frozenset(replay_events(events).items()) for _ in range(10)}
 
         # All replays should produce same state
-        assert len(set(states)) == 1, "Event replay is non-deterministic"
+        assert len(states) == 1, "Event replay is non-deterministic"
 
     def test_partial_event_history(self):
         """Should handle incomplete event history gracefully."""
@@ -327,10 +394,7 @@ class TestChaosWorkflowResilience:
         ]
 
         # Should not crash (graceful degradation)
-        state = {}
-        for event in incomplete_events:
-            if isinstance(event, GoalReceived):
-                state["goal"] = event.goal
+        state = replay_events(incomplete_events)
 
         assert "goal" in state
 
@@ -4,14 +4,43 @@ Contract tests for DatabaseProvider interface compliance.
 Ensures all provider implementations strictly follow the DatabaseProvider protocol.
 """
 
+import pickle
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from providers.database.base import DatabaseError
+from providers.database.base import DatabaseError, NotFoundError
 from providers.database.supabase_provider import SupabaseDatabaseProvider
 
 
+class _QueryChain:
+    """
+    Minimal stand-in for a Supabase query builder that returns fixed rows.
+
+    Every builder call (select/eq/limit/...) returns the chain itself, so tests that
+    only care about the response skip MagicMock's child-mock bookkeeping.
+    """
+
+    def __init__(self, rows: list[dict[str, Any]]):
+        self._response = SimpleNamespace(data=rows)
+
+    def __getattr__(self, _name: str) -> "_QueryChain":
+        return self
+
+    def __call__(self, *_args: Any, **_kwargs: Any) -> "_QueryChain":
+        return self
+
+    def execute(self) -> SimpleNamespace:
+        return self._response
+
+
+def _stub_rows(provider: SupabaseDatabaseProvider, rows: list[dict[str, Any]]) -> None:
+    """Make every query on provider return rows."""
+    provider.client.table = lambda _table: _QueryChain(rows)
+
+
 class TestDatabaseProviderContract:
     """Test DatabaseProvider interface compliance."""
 
@@ -32,14 +61,10 @@ class TestDatabaseProviderContract:
             return provider
 
     @pytest.mark.asyncio
-    async def test_delete_returns_int(self, provider, mock_supabase_client):
+    async def test_delete_returns_int(self, provider):
         """delete() must return int (count of deleted rows), not bool."""
-        _, mock_table = mock_supabase_client
-
         # Mock successful deletion of 2 rows
-        mock_response = MagicMock()
-        mock_response.data = [{"id": 1}, {"id": 2}]
-        mock_table.delete.return_value.eq.return_value.execute.return_value = mock_response
+        _stub_rows(provider, [{"id": 1}, {"id": 2}])
 
         result = await provider.delete("audit_logs", {"workflow_id": "test"})
 
@@ -47,19 +72,40 @@ class TestDatabaseProviderContract:
         assert result == 2, "delete() should return count of deleted rows"
 
     @pytest.mark.asyncio
-    async def test_delete_returns_zero_when_no_rows_deleted(self, provider, mock_supabase_client):
+    async def test_delete_returns_zero_when_no_rows_deleted(self, provider):
         """delete() must return 0 when no rows match."""
-        _, mock_table = mock_supabase_client
-
         # Mock no rows deleted
-        mock_response = MagicMock()
-        mock_response.data = []
-        mock_table.delete.return_value.eq.return_value.execute.return_value = mock_response
+        _stub_rows(provider, [])
 
         result = await provider.delete("audit_logs", {"id": "nonexistent"})
 
         assert result == 0, "delete() should return 0 when no rows deleted"
 
+    @pytest.mark.asyncio
+    async def test_delete_disallowed_table_error_not_rewrapped(self, provider):
+        """delete() must surface validation errors without re-wrapping them."""
+        with pytest.raises(DatabaseError) as exc_info:
+            await provider.delete("forbidden_table", {"id": 1})
+
+        assert "not in the allowed list" in str(exc_info.value)
+        assert "Database delete failed" not in str(exc_info.value)
+        assert exc_info.value.__cause__ is None
+
+    @pytest.mark.asyncio
+    async def test_sdk_failure_wrapped_with_cause(self, provider, mock_supabase_client):
+        """SDK failures must be wrapped in DatabaseError keeping the original cause."""
+        _, mock_table = mock_supabase_client
+
+        boom = RuntimeError("connection reset")
+        mock_table.insert.return_value.execute.side_effect = boom
+
+        with pytest.raises(DatabaseError) as exc_info:
+            await provider.insert("audit_logs", {"id": 1})
+
+        assert exc_info.value.cause is boom
+        assert exc_info.value.__cause__ is boom
+        assert str(exc_info.value) == "Database insert failed: connection reset"
+
     @pytest.mark.asyncio
     async def test_select_method_exists(self, provider):
         """select() method must exist and match protocol signature."""
@@ -76,13 +122,9 @@ class TestDatabaseProviderContract:
         assert "select_fields" in params, "select() must have 'select_fields' parameter"
 
     @pytest.mark.asyncio
-    async def test_select_returns_list(self, provider, mock_supabase_client):
+    async def test_select_returns_list(self, provider):
         """select() must return list of dicts."""
-        _, mock_table = mock_supabase_client
-
-        mock_response = MagicMock()
-        mock_response.data = [{"id": 1, "name": "test"}]
-        mock_table.select.return_value.eq.return_value.execute.return_value = mock_response
+        _stub_rows(provider, [{"id": 1, "name": "test"}])
 
         result = await provider.select("audit_logs", filters={"id": 1})
 
@@ -90,6 +132,102 @@ class TestDatabaseProviderContract:
         assert len(result) == 1
         assert result[0]["name"] == "test"
 
+    @pytest.mark.asyncio
+    async def test_select_one_limits_to_single_row(self, provider, mock_supabase_client):
+        """select_one() must ask PostgREST for a single row only."""
+        _, mock_table = mock_supabase_client
+
+        mock_response = MagicMock()
+        mock_response.data = [{"id": 1}]
+        mock_eq = mock_table.select.return_value.eq.return_value
+        mock_eq.limit.return_value.execute.return_value = mock_response
+
+        result = await provider.select_one("man_tasks", {"id": 1})
+
+        mock_eq.limit.assert_called_once_with(1)
+        assert result == {"id": 1}
+
+    @pytest.mark.asyncio
+    async def test_select_one_raises_not_found(self, provider, mock_supabase_client):
+        """select_one() must raise NotFoundError carrying the lookup details."""
+        _, mock_table = mock_supabase_client
+
+        mock_eq = mock_table.select.return_value.eq.return_value
+        mock_eq.limit.return_value.execute.return_value = MagicMock(data=[])
+
+        with pytest.raises(NotFoundError) as exc_info:
+            await provider.select_one("man_tasks", {"id": 42})
+
+        assert exc_info.value.table == "man_tasks"
+        assert exc_info.value.filters == {"id": 42}
+        assert str(exc_info.value) == "Record not found in man_tasks matching: id=42"
+        assert exc_info.value.message == str(exc_info.value)
+        assert exc_info.value.args == ("man_tasks", {"id": 42})
+
+        restored = pickle.loads(pickle.dumps(exc_info.value))  # noqa: S301 - Own payload
+        assert str(restored) == str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_update_raises_not_found(self, provider, mock_supabase_client):
+        """update() must keep its own not-found wording."""
+        _, mock_table = mock_supabase_client
+
+        mock_eq = mock_table.update.return_value.eq.return_value
+        mock_eq.execute.return_value = MagicMock(data=[])
+
+        with pytest.raises(NotFoundError) as exc_info:
+            await provider.update("man_tasks", {"status": "done"}, {"id": 42})
+
+        assert str(exc_info.value) == "No records to update in man_tasks with {'id': 42}"
+
+    @pytest.mark.asyncio
+    async def test_prepare_binds_filters(self, provider, mock_supabase_client):
+        """prepare() must return a query function with filters pre-bound."""
+        _, mock_table = mock_supabase_client
+
+        mock_eq = mock_table.select.return_value.eq.return_value
+        mock_eq.limit.return_value.execute.return_value = MagicMock(data=[{"id": 7}])
+
+        get_task = provider.prepare("man_tasks", ("id",), limit=1)
+        result = await get_task(7)
+
+        mock_table.select.return_value.eq.assert_called_once_with("id", 7)
+        mock_eq.limit.assert_called_once_with(1)
+        assert result == [{"id": 7}]
+
+    def test_prepare_validates_once_up_front(self, provider):
+        """prepare() must reject disallowed tables and columns immediately."""
+        with pytest.raises(DatabaseError, match="not in the allowed list"):
+            provider.prepare("forbidden_table", ("id",))
+        with pytest.raises(DatabaseError, match="Invalid column name"):
+            provider.prepare("man_tasks", ("id; drop",))
+
+    @pytest.mark.asyncio
+    async def test_prepared_query_rejects_wrong_arity(self, provider):
+        """Prepared queries must be called with one value per filter column."""
+        get_task = provider.prepare("man_tasks", ("id", "status"))
+        with pytest.raises(DatabaseError, match="expects 2 values"):
+            await get_task("only-one")
+
+    @pytest.mark.asyncio
+    async def test_queries_execute_off_event_loop_thread(self, provider, mock_supabase_client):
+        """Blocking SDK execute() calls must not run on the event loop thread."""
+        import threading
+
+        _, mock_table = mock_supabase_client
+        loop_thread = threading.get_ident()
+        seen_threads: list[int] = []
+
+        def fake_execute():
+            seen_threads.append(threading.get_ident())
+            return MagicMock(data=[{"id": 1}])
+
+        mock_table.select.return_value.execute.side_effect = fake_execute
+
+        await provider.select("man_tasks")
+
+        assert seen_threads and seen_threads[0] != loop_thread
+
     @pytest.mark.asyncio
     async def test_disallowed_table_raises_database_error(self, provider):
         """Accessing disallowed table must raise DatabaseError."""
@@ -107,32 +245,198 @@ class TestDatabaseProviderContract:
         assert "not in the allowed list" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_man_tasks_table_allowed(self, provider, mock_supabase_client):
+    async def test_man_tasks_table_allowed(self, provider):
         """man_tasks table must be in allowlist."""
-        _, mock_table = mock_supabase_client
-
-        mock_response = MagicMock()
-        mock_response.data = [{"id": 1}]
-        mock_table.select.return_value.execute.return_value = mock_response
+        _stub_rows(provider, [{"id": 1}])
 
         # Should not raise DatabaseError
         result = await provider.select("man_tasks")
         assert isinstance(result, list)
 
     @pytest.mark.asyncio
-    async def test_man_notifications_table_allowed(self, provider, mock_supabase_client):
+    async def test_man_notifications_table_allowed(self, provider):
         """man_notifications table must be in allowlist."""
-        _, mock_table = mock_supabase_client
-
-        mock_response = MagicMock()
-        mock_response.data = []
-        mock_table.select.return_value.execute.return_value = mock_response
+        _stub_rows(provider, [])
 
         # Should not raise DatabaseError
         result = await provider.select("man_notifications")
         assert isinstance(result, list)
 
 
+class TestClientCache:
+    """Test that providers share Supabase clients per credentials."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        SupabaseDatabaseProvider.clear_client_cache()
+        yield
+        SupabaseDatabaseProvider.clear_client_cache()
+
+    def test_same_credentials_share_client(self):
+        """Providers built with the same url/key must reuse one client."""
+        with patch("providers.database.supabase_provider.create_client") as mock_create:
+            first = SupabaseDatabaseProvider(url="https://test.example.com", key="k1")
+            second = SupabaseDatabaseProvider(url="https://test.example.com", key="k1")
+
+        assert first.client is second.client
+        mock_create.assert_called_once_with("https://test.example.com", "k1")
+
+    def test_different_credentials_get_separate_clients(self):
+        """Different keys must not share a client."""
+        with patch(
+            "providers.database.supabase_provider.create_client",
+            side_effect=lambda _url, key: MagicMock(name=key),
+        ):
+            first = SupabaseDatabaseProvider(url="https://test.example.com", key="k1")
+            second = SupabaseDatabaseProvider(url="https://test.example.com", key="k2")
+
+        assert first.client is not second.client
+
+    def test_providers_share_executor(self):
+        """Re-created providers must not each start their own thread pool."""
+        with patch(
+            "providers.database.supabase_provider.create_client",
+            side_effect=lambda _url, key: MagicMock(name=key),
+        ):
+            first = SupabaseDatabaseProvider(url="https://test.example.com", key="k1")
+            second = SupabaseDatabaseProvider(url="https://test.example.com", key="k2")
+
+        assert first._executor is second._executor
+
+
+class TestSelectOneCache:
+    """Test the opt-in select_one read-through cache."""
+
+    @pytest.fixture
+    def cached_provider(self):
+        with patch("providers.database.supabase_provider.create_client"):
+            provider = SupabaseDatabaseProvider(
+                url="https://test.example.com", key="test-key", select_cache_ttl_seconds=30
+            )
+        provider.client = MagicMock()
+        limited = provider.client.table.return_value.select.return_value.eq.return_value.limit
+        limited.return_value.execute.return_value = MagicMock(data=[{"id": 1, "value": "a"}])
+        return provider, limited.return_value.execute
+
+    @pytest.mark.asyncio
+    async def test_repeated_lookup_served_from_cache(self, cached_provider):
+        """Second identical select_one must not hit the database."""
+        provider, execute = cached_provider
+
+        first = await provider.select_one("settings", {"id": 1})
+        second = await provider.select_one("settings", {"id": 1})
+
+        assert first == second == {"id": 1, "value": "a"}
+        assert execute.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_after_ttl(self, cached_provider):
+        """Cached rows must be refetched once the TTL has passed."""
+        provider, execute = cached_provider
+
+        with patch("providers.database.supabase_provider.time.monotonic", return_value=100.0):
+            await provider.select_one("settings", {"id": 1})
+        with patch("providers.database.supabase_provider.time.monotonic", return_value=131.0):
+            await provider.select_one("settings", {"id": 1})
+
+        assert execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_table(self, cached_provider):
+        """Writes through the provider must drop cached rows for that table."""
+        provider, execute = cached_provider
+        update_eq = provider.client.table.return_value.update.return_value.eq.return_value
+        update_eq.execute.return_value = MagicMock(data=[{"id": 1, "value": "b"}])
+
+        await provider.select_one("settings", {"id": 1})
+        await provider.update("settings", {"value": "b"}, {"id": 1})
+        await provider.select_one("settings", {"id": 1})
+
+        assert execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_write_during_read_not_cached(self, cached_provider):
+        """A row read before a concurrent write must not be cached."""
+        provider, _ = cached_provider
+        reads = 0
+
+        async def read_racing_write(*_args):
+            nonlocal reads
+            reads += 1
+            provider.invalidate("settings")  # A write lands while the read is in flight
+            return [{"id": 1, "value": "stale"}]
+
+        provider._select_limited = read_racing_write
+        await provider.select_one("settings", {"id": 1})
+        await provider.select_one("settings", {"id": 1})
+
+        assert reads == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_bounded_across_tables(self, cached_provider, monkeypatch):
+        """The entry limit applies to all tables together, evicting the oldest row."""
+        provider, _ = cached_provider
+        monkeypatch.setattr("providers.database.supabase_provider.SELECT_CACHE_MAX_ENTRIES", 2)
+
+        await provider.select_one("settings", {"id": 1})
+        await provider.select_one("users", {"id": 1})
+        await provider.select_one("profiles", {"id": 1})
+
+        assert [table for table, _ in provider._select_cache] == ["users", "profiles"]
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled_by_default(self):
+        """Without a TTL every select_one must hit the database."""
+        with patch("providers.database.supabase_provider.create_client"):
+            provider = SupabaseDatabaseProvider(url="https://test.example.com", key="test-key")
+        provider.client = MagicMock()
+        limited = provider.client.table.return_value.select.return_value.eq.return_value.limit
+        limited.return_value.execute.return_value = MagicMock(data=[{"id": 1}])
+
+        await provider.select_one("settings", {"id": 1})
+        await provider.select_one("settings", {"id": 1})
+
+        assert limited.return_value.execute.call_count == 2
+
+
+class TestDatabaseFactory:
+    """Test provider factory environment handling."""
+
+    @pytest.fixture(autouse=True)
+    def reset_factory(self):
+        from providers.database.factory import reset_database_provider
+
+        reset_database_provider(reload_env=True)
+        yield
+        reset_database_provider(reload_env=True)
+
+    def test_env_read_once_across_resets(self, monkeypatch):
+        """reset_database_provider() must keep the environment snapshot by default."""
+        from providers.database import factory
+
+        monkeypatch.setenv("DATABASE_PROVIDER", "supabase")
+        with patch("providers.database.supabase_provider.create_client"):
+            factory.get_database_provider()
+            monkeypatch.setenv("DATABASE_PROVIDER", "unknown")
+            factory.reset_database_provider()
+            provider = factory.get_database_provider()
+
+        assert isinstance(provider, SupabaseDatabaseProvider)
+
+    def test_reload_env_picks_up_changes(self, monkeypatch):
+        """reset_database_provider(reload_env=True) must re-read the environment."""
+        from providers.database import factory
+
+        monkeypatch.setenv("DATABASE_PROVIDER", "supabase")
+        with patch("providers.database.supabase_provider.create_client"):
+            factory.get_database_provider()
+        monkeypatch.setenv("DATABASE_PROVIDER", "unknown")
+        factory.reset_database_provider(reload_env=True)
+
+        with pytest.raises(ValueError, match="Unknown DATABASE_PROVIDER"):
+            factory.get_database_provider()
+
+
 class TestBackwardsCompatibility:
     """Test backwards compatibility alias."""
 
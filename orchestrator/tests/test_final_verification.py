@@ -22,9 +22,9 @@ class TestBootStability:
     def test_dependencies_pinned(self):
         """FastAPI and Uvicorn must be pinned in pyproject.toml."""
         with open("pyproject.toml") as f:
-            content = f.read()
-            assert "fastapi" in content.lower(), "FastAPI not in dependencies"
-            assert "uvicorn" in content.lower(), "Uvicorn not in dependencies"
+            content = f.read().lower()
+        assert "fastapi" in content, "FastAPI not in dependencies"
+        assert "uvicorn" in content, "Uvicorn not in dependencies"
 
     @pytest.mark.skip("Requires docker-compose")
     def test_docker_compose_stays_green(self):
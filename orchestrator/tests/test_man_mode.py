@@ -22,6 +22,12 @@ from policies.man_policy import (
 )
 
 
+@pytest.fixture(scope="module")
+def policy():
+    """Default-configured policy shared by the module (triage keeps no state)."""
+    return ManPolicy()
+
+
 class TestRiskLaneEnum:
     """Test RiskLane enum values."""
 
@@ -185,44 +191,30 @@ class TestIdempotencyKey:
 class TestManPolicy:
     """Test ManPolicy risk classification engine."""
 
-    def test_sensitive_tool_red_lane(self):
-        """Sensitive tools should return RED lane."""
-        policy = ManPolicy()
-        intent = ActionIntent(
-            tool_name="delete_record",
-            workflow_id="wf-1",
-        )
-        result = policy.triage(intent)
-        assert result.risk_lane == RiskLane.RED
-        assert result.requires_approval is True
-        # reasoning should contain risk factor
-        assert "requires human approval" in result.reasoning
-
-    def test_blocked_tool_blocked_lane(self):
-        """Blocked tools should return BLOCKED lane."""
-        policy = ManPolicy()
-        intent = ActionIntent(
-            tool_name="execute_sql_raw",
-            workflow_id="wf-1",
-        )
-        result = policy.triage(intent)
-        assert result.risk_lane == RiskLane.BLOCKED
-        assert result.requires_approval is False
-
-    def test_safe_tool_green_lane(self):
-        """Safe tools should return GREEN lane."""
-        policy = ManPolicy()
-        intent = ActionIntent(
-            tool_name="search_database",
-            workflow_id="wf-1",
-        )
-        result = policy.triage(intent)
-        assert result.risk_lane == RiskLane.GREEN
-        assert result.requires_approval is False
-
-    def test_irreversible_flag_red_lane(self):
+    @pytest.mark.parametrize(
+        ("tool_name", "expected_lane", "expected_reason"),
+        [
+            pytest.param("delete_record", RiskLane.RED, "requires human approval", id="sensitive"),
+            pytest.param("execute_sql_raw", RiskLane.BLOCKED, "is prohibited", id="blocked"),
+            pytest.param("search_database", RiskLane.GREEN, None, id="safe"),
+            pytest.param("some_random_tool", RiskLane.YELLOW, "Unknown tool", id="unknown"),
+            # Tool matching is case-insensitive
+            pytest.param("DELETE_RECORD", RiskLane.RED, None, id="uppercase"),
+            # Empty tool name defaults to YELLOW (unknown)
+            pytest.param("", RiskLane.YELLOW, None, id="empty"),
+            pytest.param("tool-with-dashes_and_underscores", RiskLane.YELLOW, None, id="special"),
+        ],
+    )
+    def test_tool_to_lane(self, policy, tool_name, expected_lane, expected_reason):
+        """Tool name alone should determine the lane; only RED needs approval."""
+        result = policy.triage(ActionIntent(tool_name=tool_name, workflow_id="wf-1"))
+        assert result.risk_lane == expected_lane
+        assert result.requires_approval is (expected_lane == RiskLane.RED)
+        if expected_reason is not None:
+            assert expected_reason in result.reasoning
+
+    def test_irreversible_flag_red_lane(self, policy):
         """Irreversible flag should force RED lane."""
-        policy = ManPolicy()
         intent = ActionIntent(
             tool_name="unknown_tool",
             workflow_id="wf-1",
@@ -233,46 +225,31 @@ class TestManPolicy:
         assert result.requires_approval is True
         assert "marked as irreversible" in result.reasoning
 
-    def test_unknown_tool_yellow_lane(self):
-        """Unknown tools should return YELLOW lane."""
-        policy = ManPolicy()
-        intent = ActionIntent(
-            tool_name="some_random_tool",
-            workflow_id="wf-1",
+    @pytest.mark.parametrize(
+        ("params", "expected_lane", "expected_reason"),
+        [
+            pytest.param(
+                {"force": "true"}, RiskLane.YELLOW, "High-risk parameter detected", id="single"
+            ),
+            pytest.param(
+                {"force": "true", "cascade": "true"},
+                RiskLane.RED,
+                "Multiple high-risk parameters",
+                id="multiple",
+            ),
+        ],
+    )
+    def test_high_risk_params(self, policy, params, expected_lane, expected_reason):
+        """One high-risk param should return YELLOW; several should return RED."""
+        result = policy.triage(
+            ActionIntent(tool_name="some_tool", params=params, workflow_id="wf-1")
         )
-        result = policy.triage(intent)
-        assert result.risk_lane == RiskLane.YELLOW
-        assert result.requires_approval is False
-        assert "Unknown tool" in result.reasoning
+        assert result.risk_lane == expected_lane
+        assert result.requires_approval is (expected_lane == RiskLane.RED)
+        assert expected_reason in result.reasoning
 
-    def test_high_risk_params_single_yellow(self):
-        """Single high-risk param should return YELLOW."""
-        policy = ManPolicy()
-        intent = ActionIntent(
-            tool_name="some_tool",
-            params={"force": "true"},
-            workflow_id="wf-1",
-        )
-        result = policy.triage(intent)
-        assert result.risk_lane == RiskLane.YELLOW
-        assert "High-risk parameter detected" in result.reasoning
-
-    def test_high_risk_params_multiple_red(self):
-        """Multiple high-risk params should return RED."""
-        policy = ManPolicy()
-        intent = ActionIntent(
-            tool_name="some_tool",
-            params={"force": "true", "cascade": "true"},
-            workflow_id="wf-1",
-        )
-        result = policy.triage(intent)
-        assert result.risk_lane == RiskLane.RED
-        assert result.requires_approval is True
-        assert "Multiple high-risk parameters" in result.reasoning
-
-    def test_large_amount_triggers_risk(self):
+    def test_large_amount_triggers_risk(self, policy):
         """Large financial amounts should trigger risk factor."""
-        policy = ManPolicy()
         intent = ActionIntent(
             tool_name="some_tool",
             params={"amount": 50000},
@@ -281,31 +258,18 @@ class TestManPolicy:
         result = policy.triage(intent)
         assert "large_amount" in result.reasoning
 
-    def test_case_insensitive_tool_matching(self):
-        """Tool matching should be case-insensitive."""
-        policy = ManPolicy()
-        intent = ActionIntent(
-            tool_name="DELETE_RECORD",
-            workflow_id="wf-1",
-        )
-        result = policy.triage(intent)
-        assert result.risk_lane == RiskLane.RED
-
-    def test_is_sensitive_helper(self):
+    def test_is_sensitive_helper(self, policy):
         """is_sensitive helper should work correctly."""
-        policy = ManPolicy()
         assert policy.is_sensitive("delete_record") is True
         assert policy.is_sensitive("search_database") is False
 
-    def test_is_blocked_helper(self):
+    def test_is_blocked_helper(self, policy):
         """is_blocked helper should work correctly."""
-        policy = ManPolicy()
         assert policy.is_blocked("execute_sql_raw") is True
         assert policy.is_blocked("delete_record") is False
 
-    def test_is_safe_helper(self):
+    def test_is_safe_helper(self, policy):
         """is_safe helper should work correctly."""
-        policy = ManPolicy()
         assert policy.is_safe("search_database") is True
         assert policy.is_safe("delete_record") is False
 
@@ -324,17 +288,43 @@ class TestManPolicy:
 class TestManPolicyPerformance:
     """Test ManPolicy performance optimizations."""
 
-    def test_cached_lowercase_sets_exist(self):
+    def test_cached_lowercase_sets_exist(self, policy):
         """Policy should have cached lowercase sets."""
-        policy = ManPolicy()
         assert hasattr(policy, "_sensitive_lower")
         assert hasattr(policy, "_blocked_lower")
         assert hasattr(policy, "_safe_lower")
         assert isinstance(policy._sensitive_lower, frozenset)
 
-    def test_repeated_triage_consistent(self):
+    def test_default_policies_share_lowercase_sets(self):
+        """Default-configured policies should reuse the class-level sets."""
+        first, second = ManPolicy(), ManPolicy()
+        assert first._sensitive_lower is second._sensitive_lower
+        assert first._blocked_lower is second._blocked_lower
+        assert first._safe_lower is second._safe_lower
+        assert not hasattr(first, "__dict__")
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"tool_name": "execute_sql_raw", "workflow_id": "wf-1"},
+            {"tool_name": "delete_record", "workflow_id": "wf-1"},
+            {"tool_name": "some_tool", "workflow_id": "wf-1", "irreversible": True},
+            {"tool_name": "some_tool", "workflow_id": "wf-1", "params": {"amount": 50000}},
+            {"tool_name": "some_tool", "workflow_id": "wf-1", "params": {"scope": "all"}},
+            {"tool_name": "search_database", "workflow_id": "wf-1"},
+            {"tool_name": "unknown_tool", "workflow_id": "wf-1"},
+        ],
+    )
+    def test_triage_payload_matches_triage(self, policy, payload):
+        """Dict fast path should classify exactly like the validated path."""
+        fast = policy.triage_payload(payload)
+        strict = policy.triage(ActionIntent(**payload)).model_dump()
+        fast.pop("task_id")
+        strict.pop("task_id")
+        assert fast == strict
+
+    def test_repeated_triage_consistent(self, policy):
         """Repeated triage calls should be consistent."""
-        policy = ManPolicy()
         intent = ActionIntent(tool_name="delete_record", workflow_id="wf-1")
         result1 = policy.triage(intent)
         result2 = policy.triage(intent)
@@ -345,24 +335,8 @@ class TestManPolicyPerformance:
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
 
-    def test_empty_tool_name(self):
-        """Should handle empty tool name gracefully."""
-        policy = ManPolicy()
-        intent = ActionIntent(tool_name="", workflow_id="wf-1")
-        result = policy.triage(intent)
-        # Empty tool name defaults to YELLOW (unknown)
-        assert result.risk_lane == RiskLane.YELLOW
-
-    def test_special_characters_in_tool_name(self):
-        """Should handle special characters in tool name."""
-        policy = ManPolicy()
-        intent = ActionIntent(tool_name="tool-with-dashes_and_underscores", workflow_id="wf-1")
-        result = policy.triage(intent)
-        assert result.risk_lane == RiskLane.YELLOW
-
-    def test_exact_high_risk_param_match(self):
+    def test_exact_high_risk_param_match(self, policy):
         """Should match exact high-risk param values."""
-        policy = ManPolicy()
         # Exact match: amount=10000
         intent = ActionIntent(
             tool_name="some_tool",
@@ -372,9 +346,8 @@ class TestEdgeCases:
         result = policy.triage(intent)
         assert "high_risk_param" in result.reasoning
 
-    def test_near_threshold_amount(self):
+    def test_near_threshold_amount(self, policy):
         """Should not trigger for amounts just below threshold."""
-        policy = ManPolicy()
         intent = ActionIntent(
             tool_name="some_tool",
             params={"amount": 9999},
@@ -383,9 +356,8 @@ class TestEdgeCases:
         result = policy.triage(intent)
         assert "large_amount" not in result.reasoning
 
-    def test_negative_amount_safe(self):
+    def test_negative_amount_safe(self, policy):
         """Negative amounts should not trigger risk."""
-        policy = ManPolicy()
         intent = ActionIntent(
             tool_name="some_tool",
             params={"amount": -50000},
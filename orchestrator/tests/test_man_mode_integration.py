@@ -10,6 +10,7 @@ Tests:
 - Admin cancel step
 """
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -142,6 +143,41 @@ class TestOperatorSignals:
         pass
 
 
+class TestRiskTriage:
+    """Test risk_triage activity."""
+
+    @pytest.mark.asyncio
+    async def test_result_matches_policy_triage(self):
+        """Activity output should match ManPolicy.triage() apart from the task id."""
+        from activities.man_mode import risk_triage
+        from models.man_mode import ActionIntent
+        from policies.man_policy import ManPolicy
+
+        intent_data = {
+            "tool_name": "delete_record",
+            "params": {"id": "1"},
+            "workflow_id": "wf-1",
+            "irreversible": "false",
+        }
+
+        result = await risk_triage(intent_data)
+        expected = ManPolicy().triage(ActionIntent(**intent_data)).model_dump()
+
+        assert result.pop("task_id")
+        expected.pop("task_id")
+        assert result == expected
+
+    @pytest.mark.asyncio
+    async def test_invalid_intent_rejected(self):
+        """Invalid intents should fail validation (non-retryable)."""
+        from temporalio.exceptions import ApplicationError
+
+        from activities.man_mode import risk_triage
+
+        with pytest.raises(ApplicationError, match="Risk triage failed"):
+            await risk_triage({"tool_name": "search_database"})
+
+
 class TestNotifyManTask:
     """Test notify_man_task activity."""
 
@@ -201,6 +237,37 @@ class TestNotifyManTask:
             record = captured_calls[0]["record"]
             assert record["idempotency_key"] == "man_notify:task-abc:slack"
 
+    @pytest.mark.asyncio
+    async def test_channels_upserted_concurrently(self):
+        """Channel notifications should be written concurrently, in channel order."""
+        from activities.notify_man_task import notify_man_task
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_upsert(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"id": kwargs["record"]["channel"]}
+
+        mock_db = AsyncMock()
+        mock_db.upsert = AsyncMock(side_effect=slow_upsert)
+
+        params = {
+            "task_id": "task-1",
+            "workflow_id": "wf-1",
+            "channels": ["email", "slack", "realtime"],
+        }
+
+        with patch("activities.notify_man_task.get_database_provider", return_value=mock_db):
+            result = await notify_man_task(params)
+
+        assert max_in_flight == 3
+        assert result["notification_ids"] == ["email", "slack", "realtime"]
+
 
 class TestContinueAsNew:
     """Test continue-as-new snapshot/restore."""
@@ -1,5 +1,8 @@
 """Unit tests for Pydantic models and schema validation."""
 
+import re
+from datetime import UTC, datetime
+
 import pytest
 from pydantic import ValidationError
 
@@ -83,6 +86,16 @@ class TestAgentEvents:
         assert event.user_id == "user-456"
         assert event.event_id is not None
 
+    def test_default_timestamp_is_current_utc_iso8601(self):
+        """Default timestamps should be UTC ISO 8601 with microseconds and a Z suffix."""
+        before = datetime.now(UTC)
+        event = GoalReceived(correlation_id="corr-123", goal="g", user_id="u")
+        after = datetime.now(UTC)
+
+        assert re.fullmatch(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{6}Z", event.timestamp)
+        parsed = datetime.fromisoformat(event.timestamp.replace("Z", "+00:00"))
+        assert before <= parsed <= after
+
     def test_plan_generated_event(self):
         """Should create PlanGenerated event."""
         event = PlanGenerated(
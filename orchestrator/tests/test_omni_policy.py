@@ -0,0 +1,143 @@
+"""Tests for OmniPolicy cached policy evaluation."""
+
+import asyncio
+import hashlib
+import json
+from datetime import datetime
+
+import pytest
+
+from security.omni_policy import OmniPolicyEvaluator, PolicyRecord, _hash_ctx
+
+
+def _row(name: str, priority: int = 100, **match) -> dict:
+    return {
+        "name": name,
+        "version": 1,
+        "priority": priority,
+        "match": match,
+        "decision": "DENY",
+        "lane": "RED",
+        "reason": f"{name} matched",
+    }
+
+
+def _evaluator(rows: list[dict]) -> OmniPolicyEvaluator:
+    async def loader() -> list[dict]:
+        return rows
+
+    return OmniPolicyEvaluator(cache_ttl_seconds=60, loader=loader)
+
+
+class TestPolicyRecord:
+    def test_match_sets_lowercased(self):
+        record = PolicyRecord(
+            name="p",
+            version=1,
+            priority=1,
+            match={"tool_in": ["Send_Email", "DELETE"], "action_in": []},
+            decision="DENY",
+            lane="RED",
+            reason="r",
+        )
+        assert record.match_sets == {"tool": frozenset({"send_email", "delete"})}
+
+
+class TestEvaluate:
+    @pytest.mark.asyncio
+    async def test_matches_case_insensitively(self):
+        evaluator = _evaluator([_row("block_email", tool_in=["send_email"])])
+        decision = await evaluator.evaluate({"tool": "SEND_EMAIL"})
+        assert decision["policy_name"] == "block_email"
+        assert decision["decision"] == "DENY"
+
+    @pytest.mark.asyncio
+    async def test_all_constrained_fields_must_match(self):
+        evaluator = _evaluator([_row("p", tool_in=["send_email"], resource_in=["crm"])])
+        decision = await evaluator.evaluate({"tool": "send_email", "resource": "billing"})
+        assert decision["policy_name"] == "default_allow"
+
+    @pytest.mark.asyncio
+    async def test_unconstrained_policy_matches_everything(self):
+        evaluator = _evaluator([_row("catch_all")])
+        decision = await evaluator.evaluate({"tool": "anything"})
+        assert decision["policy_name"] == "catch_all"
+
+    @pytest.mark.asyncio
+    async def test_lowest_priority_wins(self):
+        evaluator = _evaluator(
+            [
+                _row("low", priority=50, tool_in=["x"]),
+                _row("high", priority=10, tool_in=["x"]),
+            ]
+        )
+        decision = await evaluator.evaluate({"tool": "x"})
+        assert decision["policy_name"] == "high"
+
+    @pytest.mark.asyncio
+    async def test_ties_broken_by_name_then_newest_version(self):
+        rows = [_row("b", priority=10), _row("a", priority=10), _row("a", priority=10)]
+        rows[2]["version"] = 2
+        evaluator = _evaluator(rows)
+        policies = await evaluator._get_policies()
+        assert [(p.name, p.version) for p in policies] == [("a", 2), ("a", 1), ("b", 1)]
+
+    @pytest.mark.asyncio
+    async def test_decisions_memoized_until_reload(self, monkeypatch):
+        evaluator = _evaluator([_row("p", tool_in=["x"])])
+        first = await evaluator.evaluate({"tool": "X", "user_id": "u1"})
+
+        def fail(*_args):
+            raise AssertionError("memoized decision should skip matching")
+
+        monkeypatch.setattr(evaluator, "_decide", fail)
+        second = await evaluator.evaluate({"tool": "x", "user_id": "u2"})
+        assert first == second
+
+        evaluator._cache_expires_at = 0.0
+        monkeypatch.undo()
+        await evaluator.evaluate({"tool": "x"})
+        assert len(evaluator._decision_memo) == 1
+
+    @pytest.mark.asyncio
+    async def test_memoized_decision_is_a_copy(self):
+        evaluator = _evaluator([_row("p", tool_in=["x"])])
+        decision = await evaluator.evaluate({"tool": "x"})
+        decision["decision"] = "ALLOW"
+        assert (await evaluator.evaluate({"tool": "x"}))["decision"] == "DENY"
+
+
+class TestHashCtx:
+    def test_matches_canonical_json_sha256(self):
+        ctx = {"tool": "x", "nested": {"b": [1, 2.5, None], "a": "é"}, "at": datetime(2026, 1, 1)}
+        canonical = json.dumps(ctx, sort_keys=True, default=str)
+        assert _hash_ctx(ctx) == hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def test_key_order_independent(self):
+        assert _hash_ctx({"a": 1, "b": 2}) == _hash_ctx({"b": 2, "a": 1})
+
+
+class TestPolicyCache:
+    @pytest.mark.asyncio
+    async def test_fresh_cache_served_without_lock(self):
+        evaluator = _evaluator([_row("p")])
+        await evaluator._get_policies()
+
+        async with evaluator._lock:
+            # Would deadlock if the cache-hit path acquired the lock
+            policies = await evaluator._get_policies()
+        assert [p.name for p in policies] == ["p"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refresh_loads_once(self):
+        calls = 0
+
+        async def loader() -> list[dict]:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            return [_row("p")]
+
+        evaluator = OmniPolicyEvaluator(cache_ttl_seconds=60, loader=loader)
+        await asyncio.gather(*(evaluator._get_policies() for _ in range(10)))
+        assert calls == 1
@@ -1,11 +1,21 @@
 """Tests for HMAC request signing verification."""
 
 import base64
+import hashlib
+import hmac
 import time
 
 import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
 
+from security import request_signing
 from security.request_signing import (
+    SignatureVerificationMiddleware,
+    _decode_signature,
+    _get_shared_secret,
+    _is_signature_required,
+    _reset_secret_cache,
     compute_signature,
     verify_request,
 )
@@ -17,6 +27,9 @@ _TEST_SECRET = "test-secret-key-123"  # noqa: S105
 @pytest.fixture(autouse=True)
 def _set_secret(monkeypatch):
     monkeypatch.setenv("ORCHESTRATOR_SHARED_SECRET", _TEST_SECRET)
+    _reset_secret_cache()
+    yield
+    _reset_secret_cache()
 
 
 def _sign(
@@ -51,12 +64,49 @@ class TestComputeSignature:
         sig2 = compute_signature(b"key", "POST", "/p", "1", "t", b"b")
         assert sig1 != sig2
 
+    def test_matches_canonical_string_hmac(self):
+        body = b'{"a":1}'
+        canonical = f"POST\n/p\n123\ntrace\n{hashlib.sha256(body).hexdigest()}"
+        expected = hmac.new(b"key", canonical.encode("utf-8"), hashlib.sha256).digest()
+        assert compute_signature(b"key", "POST", "/p", "123", "trace", body) == expected
+
     def test_different_secret_different_sig(self):
         sig1 = compute_signature(b"key1", "POST", "/p", "1", "t", b"body")
         sig2 = compute_signature(b"key2", "POST", "/p", "1", "t", b"body")
         assert sig1 != sig2
 
 
+class TestDecodeSignature:
+    _RAW = bytes(range(32))
+
+    @pytest.mark.parametrize(
+        "encoded",
+        [
+            _RAW.hex(),
+            _RAW.hex().upper(),
+            base64.b64encode(_RAW).decode(),
+            base64.b64encode(_RAW).decode().rstrip("="),
+        ],
+    )
+    def test_accepted_encodings(self, encoded):
+        assert _decode_signature(encoded) == self._RAW
+
+    @pytest.mark.parametrize(
+        "encoded",
+        [
+            "",
+            "zz" * 32,
+            "A" * 44,
+            "!" * 43,
+            _RAW.hex()[:-2],
+            base64.b64encode(_RAW[:31]).decode(),
+        ],
+    )
+    def test_rejected_encodings(self, encoded):
+        with pytest.raises(ValueError, match="Invalid signature format"):
+            _decode_signature(encoded)
+
+
 class TestVerifyRequest:
     def test_valid_signature_hex(self):
         body = b'{"test":"data"}'
@@ -104,3 +154,70 @@ class TestVerifyRequest:
         ts, tid, sig = _sign(body=body)
         result = verify_request("POST", "/api/v1/goals", ts, tid, sig, body)
         assert result == "server_config_error"
+
+    def test_malformed_signature_skips_body_hash(self, monkeypatch):
+        def fail(*_args):
+            raise AssertionError("body should not be hashed")
+
+        monkeypatch.setattr(request_signing, "compute_signature", fail)
+        ts = str(int(time.time()))
+        result = verify_request("POST", "/api/v1/goals", ts, "t", "not-a-sig", b"x" * 1024)
+        assert result == "invalid_signature_format"
+
+
+class TestMiddleware:
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.add_middleware(SignatureVerificationMiddleware)
+
+        @app.post("/api/v1/goals")
+        async def goals() -> dict:
+            return {"ok": True}
+
+        return TestClient(app)
+
+    def _headers(self, body: bytes, timestamp: str | None = None) -> dict[str, str]:
+        ts, tid, sig = _sign(body=body, timestamp=timestamp)
+        return {"X-Omni-Timestamp": ts, "X-Omni-Trace-Id": tid, "X-Omni-Signature": sig}
+
+    def test_valid_request_passes(self, client):
+        body = b'{"goal":"x"}'
+        response = client.post("/api/v1/goals", content=body, headers=self._headers(body))
+        assert response.status_code == 200
+
+    def test_expired_timestamp_rejected_before_body_read(self, client, monkeypatch):
+        async def fail(_self):
+            raise AssertionError("body should not be read")
+
+        monkeypatch.setattr(Request, "body", fail)
+        body = b'{"goal":"x"}'
+        headers = self._headers(body, timestamp=str(int(time.time()) - 600))
+        response = client.post("/api/v1/goals", content=body, headers=headers)
+        assert response.status_code == 401
+
+
+class TestSettingsCache:
+    def test_secret_read_once(self, monkeypatch):
+        assert _get_shared_secret() == _TEST_SECRET.encode()
+        monkeypatch.setenv("ORCHESTRATOR_SHARED_SECRET", "rotated")
+        assert _get_shared_secret() == _TEST_SECRET.encode()
+
+        _reset_secret_cache()
+        assert _get_shared_secret() == b"rotated"
+
+    def test_missing_secret_not_cached(self, monkeypatch):
+        monkeypatch.delenv("ORCHESTRATOR_SHARED_SECRET", raising=False)
+        with pytest.raises(ValueError):
+            _get_shared_secret()
+
+        monkeypatch.setenv("ORCHESTRATOR_SHARED_SECRET", "late")
+        assert _get_shared_secret() == b"late"
+
+    @pytest.mark.parametrize(
+        ("env_val", "expected"),
+        [("", True), ("true", True), ("yes", True), ("false", False), ("0", False)],
+    )
+    def test_signature_required_toggle(self, monkeypatch, env_val, expected):
+        monkeypatch.setenv("ORCHESTRATOR_REQUIRE_SIGNATURE", env_val)
+        assert _is_signature_required() is expected
@@ -1,11 +1,14 @@
 """Tests for SSRF protection utilities."""
 
+import asyncio
+import ipaddress
 import socket
 from unittest.mock import patch
 
 import pytest
 
-from security.ssrf import validate_url
+from security import ssrf
+from security.ssrf import validate_url, validate_url_async
 
 
 class TestValidateUrl:
@@ -52,6 +55,35 @@ class TestValidateUrl:
             with pytest.raises(ValueError, match="is not allowed"):
                 validate_url(url)
 
+    @pytest.mark.parametrize(
+        ("url", "blocked"),
+        [
+            ("http://93.184.216.34", False),  # NOSONAR
+            ("http://[2606:2800:220:1::]", False),  # NOSONAR
+            ("http://10.0.0.1", True),  # NOSONAR
+            ("http://[::1]", True),  # NOSONAR
+        ],
+    )
+    def test_ip_literal_skips_dns(self, url, blocked):
+        """Test that IP literals are checked without resolving them."""
+        with patch("socket.getaddrinfo") as mock_getaddrinfo:
+            if blocked:
+                with pytest.raises(ValueError, match="is not allowed"):
+                    validate_url(url)
+            else:
+                assert validate_url(url) == url
+            mock_getaddrinfo.assert_not_called()
+
+    def test_digit_leading_hostname_resolved(self):
+        """Test that hostnames starting with a digit still go through DNS."""
+        with patch("socket.getaddrinfo") as mock_getaddrinfo:
+            mock_getaddrinfo.return_value = [
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", 80))  # NOSONAR
+            ]
+            with pytest.raises(ValueError, match="Resolved IP 10.0.0.1"):
+                validate_url("http://1password.example")  # NOSONAR
+            mock_getaddrinfo.assert_called_once()
+
     def test_private_ip_resolution(self):
         """Test that hostnames resolving to private IPs are rejected."""
         with patch("socket.getaddrinfo") as mock_getaddrinfo:
@@ -106,6 +138,18 @@ class TestValidateUrl:
         with pytest.raises(ValueError, match="Private address"):
             validate_url("http://[::ffff:10.0.0.1]")  # NOSONAR
 
+    @pytest.mark.parametrize("url", ["http://[::1", "http://[not-an-ip]/"])  # NOSONAR
+    def test_malformed_url(self, url):
+        """Test that urlparse errors surface as an invalid URL format."""
+        with pytest.raises(ValueError, match="Invalid URL format"):
+            validate_url(url)
+
+    @pytest.mark.parametrize("url", [["http://x"], {"url": "http://x"}, b"http://x"])  # NOSONAR
+    def test_non_string_url(self, url):
+        """Test that non-string input is rejected as ValueError, not TypeError."""
+        with pytest.raises(ValueError, match="Invalid URL format"):
+            validate_url(url)
+
     def test_empty_url(self):
         """Test empty URL."""
         with pytest.raises(ValueError, match="URL cannot be empty"):
@@ -122,3 +166,161 @@ class TestValidateUrl:
             mock_getaddrinfo.side_effect = socket.gaierror("Name or service not known")
             with pytest.raises(ValueError, match="Could not resolve hostname"):
                 validate_url("http://nonexistent.domain")  # NOSONAR
+
+
+class TestCheckIp:
+    def test_verdicts_memoized(self):
+        """Test that repeat checks of an address reuse the cached verdict."""
+        ssrf._blocked_reason.cache_clear()
+        public = ipaddress.ip_address("93.184.216.34")  # NOSONAR
+        private = ipaddress.ip_address("10.0.0.1")  # NOSONAR
+        for _ in range(3):
+            ssrf._check_ip(public)
+            with pytest.raises(ValueError, match="Private address 10.0.0.1"):
+                ssrf._check_ip(private)
+        info = ssrf._blocked_reason.cache_info()
+        assert (info.misses, info.hits) == (2, 4)
+
+
+class TestValidateUrlAsync:
+    @pytest.mark.asyncio
+    async def test_valid_public_url(self):
+        """Test that resolved public hosts pass."""
+        with patch("socket.getaddrinfo") as mock_getaddrinfo:
+            mock_getaddrinfo.return_value = [
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 80))  # NOSONAR
+            ]
+            url = "https://example.com/hook"  # NOSONAR
+            assert await validate_url_async(url) == url
+
+    @pytest.mark.asyncio
+    async def test_private_resolution_blocked(self):
+        """Test that hosts resolving to private IPs are rejected."""
+        with patch("socket.getaddrinfo") as mock_getaddrinfo:
+            mock_getaddrinfo.return_value = [
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", 80))  # NOSONAR
+            ]
+            with pytest.raises(ValueError, match="Private address"):
+                await validate_url_async("http://internal.example")  # NOSONAR
+
+    @pytest.mark.asyncio
+    async def test_literal_checked_without_executor(self, monkeypatch):
+        """Test that IP literals are rejected without leaving the event loop."""
+
+        def fail(*_args):
+            raise AssertionError("literal check should not use the executor")
+
+        monkeypatch.setattr(asyncio.get_running_loop(), "run_in_executor", fail)
+        with pytest.raises(ValueError, match="Loopback address"):
+            await validate_url_async("http://127.0.0.1/admin")  # NOSONAR
+
+    @pytest.mark.asyncio
+    async def test_resolution_failure(self):
+        """Test that DNS failures surface as ValueError."""
+        with patch("socket.getaddrinfo") as mock_getaddrinfo:
+            mock_getaddrinfo.side_effect = socket.gaierror("Name or service not known")
+            with pytest.raises(ValueError, match="Could not resolve hostname"):
+                await validate_url_async("http://nonexistent.domain")  # NOSONAR
+
+    @pytest.mark.asyncio
+    async def test_non_string_url(self):
+        """Test that unhashable input is rejected before the verdict cache."""
+        with pytest.raises(ValueError, match="Invalid URL format"):
+            await validate_url_async(["http://example.com"])  # NOSONAR
+
+
+class TestDnsCache:
+    @pytest.fixture(autouse=True)
+    def _enable_cache(self, monkeypatch):
+        monkeypatch.setattr(ssrf, "DNS_CACHE_TTL_SECONDS", 60.0)
+        ssrf.clear_dns_cache()
+        yield
+        ssrf.clear_dns_cache()
+
+    def test_repeated_validation_resolves_once(self):
+        """Test that a cached resolution is reused within the TTL."""
+        with patch("socket.getaddrinfo") as mock_getaddrinfo:
+            mock_getaddrinfo.return_value = [
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 80))  # NOSONAR
+            ]
+            for _ in range(3):
+                validate_url("http://example.com/hook")  # NOSONAR
+            mock_getaddrinfo.assert_called_once()
+
+    def test_cached_private_resolution_still_blocked(self):
+        """Test that a cached resolution is re-checked on every call."""
+        with patch("socket.getaddrinfo") as mock_getaddrinfo:
+            mock_getaddrinfo.return_value = [
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", 80))  # NOSONAR
+            ]
+            for _ in range(2):
+                with pytest.raises(ValueError, match="Private address"):
+                    validate_url("http://internal.example")  # NOSONAR
+            mock_getaddrinfo.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_async_shares_cache(self):
+        """Test that sync and async validation use the same cache."""
+        with patch("socket.getaddrinfo") as mock_getaddrinfo:
+            mock_getaddrinfo.return_value = [
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 80))  # NOSONAR
+            ]
+            validate_url("http://example.com")  # NOSONAR
+            await validate_url_async("http://example.com/other")  # NOSONAR
+            mock_getaddrinfo.assert_called_once()
+
+    def test_expired_entry_re_resolved(self):
+        """Test that entries past the TTL are resolved again."""
+        with patch("socket.getaddrinfo") as mock_getaddrinfo:
+            mock_getaddrinfo.return_value = [
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 80))  # NOSONAR
+            ]
+            validate_url("http://example.com")  # NOSONAR
+            _, addr_infos = ssrf._dns_cache["example.com"]
+            ssrf._dns_cache["example.com"] = (0.0, addr_infos)  # Long expired
+            validate_url("http://example.com/other")  # NOSONAR
+            assert mock_getaddrinfo.call_count == 2
+
+    def test_accepted_url_skips_revalidation(self, monkeypatch):
+        """Test that an accepted URL is served from the verdict cache."""
+        with patch("socket.getaddrinfo") as mock_getaddrinfo:
+            mock_getaddrinfo.return_value = [
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 80))  # NOSONAR
+            ]
+            url = "https://example.com/hook"  # NOSONAR
+            validate_url(url)
+
+        def fail(*_args):
+            raise AssertionError("cached URL should not be re-parsed")
+
+        monkeypatch.setattr(ssrf, "_parse_hostname", fail)
+        assert validate_url(url) == url
+
+    def test_verdict_expires_with_resolution(self):
+        """Test that a verdict never outlives the DNS entry it was checked against."""
+        with patch("socket.getaddrinfo") as mock_getaddrinfo:
+            mock_getaddrinfo.return_value = [
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 80))  # NOSONAR
+            ]
+            validate_url("http://example.com")  # NOSONAR
+            expires_at, addr_infos = ssrf._dns_cache["example.com"]
+            ssrf._dns_cache["example.com"] = (expires_at - 30, addr_infos)  # Aged resolution
+            validate_url("http://example.com/hook")  # NOSONAR
+
+        assert ssrf._url_verdict_cache["http://example.com/hook"] == expires_at - 30  # NOSONAR
+
+    def test_blocked_url_not_cached(self):
+        """Test that rejected URLs are validated again every time."""
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Loopback address"):
+                validate_url("http://127.0.0.1/admin")  # NOSONAR
+        assert "http://127.0.0.1/admin" not in ssrf._url_verdict_cache  # NOSONAR
+
+    def test_failed_resolution_not_cached(self):
+        """Test that lookup failures are retried."""
+        with patch("socket.getaddrinfo") as mock_getaddrinfo:
+            mock_getaddrinfo.side_effect = socket.gaierror("Name or service not known")
+            for _ in range(2):
+                with pytest.raises(ValueError, match="Could not resolve hostname"):
+                    validate_url("http://nonexistent.domain")  # NOSONAR
+            assert mock_getaddrinfo.call_count == 2